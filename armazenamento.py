@@ -0,0 +1,549 @@
+import threading
+from collections import deque
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from enums import Turno
+from indices import IndicePrefixo
+
+
+TURNO_DTYPE = pd.CategoricalDtype([t.value for t in Turno])
+_JANELA_VARREDURA = 4096
+COLUNAS_REGISTROS = {
+    'id': np.int64,
+    'matricula': object,
+    'entrada': 'datetime64[ns]',
+    'saida': 'datetime64[ns]'
+}
+
+
+def dia(instantes) -> np.ndarray:
+    """Dias desde a época (inteiros) de um datetime ou de um array datetime64"""
+    return np.asarray(instantes, dtype='datetime64[ns]').astype('datetime64[D]').astype(np.int64)
+
+
+def depois_da_entrada(entrada, saida) -> np.ndarray:
+    """Saída anterior à entrada é do dia seguinte (turno que passou da meia-noite)"""
+    entrada = np.asarray(entrada, dtype='datetime64[ns]')
+    saida = np.asarray(saida, dtype='datetime64[ns]')
+    return np.where(saida < entrada, saida + np.timedelta64(1, 'D'), saida)
+
+
+def mes(instantes) -> np.ndarray:
+    """Meses desde a época (inteiros) de um datetime ou de um array datetime64"""
+    return np.asarray(instantes, dtype='datetime64[ns]').astype('datetime64[M]').astype(np.int64)
+
+
+class TabelaColunar:
+    """Tabela em colunas numpy com crescimento geométrico e DataFrame sob demanda
+    
+    Colunas declaradas com pd.CategoricalDtype são guardadas como códigos int8.
+    """
+    
+    def __init__(self, colunas: dict, capacidade: int = 1024):
+        self.dtypes = dict(colunas)
+        self.versao = 0
+        self._tamanho = 0
+        self._capacidade = capacidade
+        self._categorias = {nome: pd.Index(dtype.categories) for nome, dtype in self.dtypes.items()
+                            if isinstance(dtype, pd.CategoricalDtype)}
+        self._colunas = {nome: np.empty(capacidade, dtype=np.int8 if nome in self._categorias else dtype)
+                         for nome, dtype in self.dtypes.items()}
+        self._df = None
+    
+    def __len__(self) -> int:
+        return self._tamanho
+    
+    def _crescer(self, minimo: int) -> None:
+        """Dobra a capacidade até comportar `minimo` linhas"""
+        capacidade = self._capacidade
+        while capacidade < minimo:
+            capacidade *= 2
+        for nome, coluna in self._colunas.items():
+            nova = np.empty(capacidade, dtype=coluna.dtype)
+            nova[:self._tamanho] = coluna[:self._tamanho]
+            self._colunas[nome] = nova
+        self._capacidade = capacidade
+    
+    def _alterada(self) -> None:
+        self._df = None
+        self.versao += 1
+    
+    def _codificar(self, nome: str, valores):
+        """Converte valores de colunas categóricas em códigos (-1 se fora das categorias)"""
+        categorias = self._categorias.get(nome)
+        if categorias is None or valores is None:
+            return valores
+        if np.ndim(valores) == 0:
+            return categorias.get_indexer([valores])[0]
+        return categorias.get_indexer(valores)
+    
+    def _decodificar(self, nome: str, valores):
+        if nome not in self._categorias:
+            return valores
+        return pd.Categorical.from_codes(valores, dtype=self.dtypes[nome])
+    
+    def anexar(self, **valores) -> int:
+        """Anexa uma linha em O(1) amortizado e retorna sua posição"""
+        posicao = self._tamanho
+        if posicao == self._capacidade:
+            self._crescer(posicao + 1)
+        for nome, coluna in self._colunas.items():
+            coluna[posicao] = self._codificar(nome, valores.get(nome))
+        self._tamanho += 1
+        self._alterada()
+        return posicao
+    
+    def estender(self, **colunas) -> np.ndarray:
+        """Anexa várias linhas de uma vez e retorna suas posições"""
+        inicio = self._tamanho
+        fim = inicio + len(next(iter(colunas.values())))
+        if fim > self._capacidade:
+            self._crescer(fim)
+        for nome, coluna in self._colunas.items():
+            coluna[inicio:fim] = self._codificar(nome, colunas.get(nome))
+        self._tamanho = fim
+        self._alterada()
+        return np.arange(inicio, fim)
+    
+    def atualizar(self, posicao, coluna: str, valor) -> None:
+        """Altera o valor de uma célula (ou de várias, com arrays de posições e valores)"""
+        self._colunas[coluna][posicao] = self._codificar(coluna, valor)
+        self._alterada()
+    
+    def valor(self, posicao: int, coluna: str):
+        """Lê o valor de uma célula"""
+        valor = self._colunas[coluna][posicao]
+        categorias = self._categorias.get(coluna)
+        if categorias is None:
+            return valor
+        return categorias[valor] if valor >= 0 else None
+    
+    def coluna(self, nome: str) -> np.ndarray:
+        """Visão (sem cópia) das linhas preenchidas de uma coluna (códigos, se categórica)"""
+        return self._colunas[nome][:self._tamanho]
+    
+    def linhas(self, posicoes: np.ndarray) -> pd.DataFrame:
+        """DataFrame só com as linhas pedidas, indexado pela posição"""
+        return pd.DataFrame({nome: self._decodificar(nome, coluna[posicoes]) for nome, coluna in self._colunas.items()},
+                            index=posicoes)
+    
+    def para_dataframe(self) -> pd.DataFrame:
+        """Materializa a tabela como DataFrame; a visão é reaproveitada até a próxima escrita"""
+        if self._df is None:
+            self._df = pd.DataFrame({nome: self._decodificar(nome, self.coluna(nome).copy()) for nome in self._colunas})
+        return self._df
+
+
+class ContadorVarredura(threading.local):
+    """Linhas examinadas pelas consultas, contadas por thread (para as métricas)"""
+    total = 0
+
+
+class EstatisticasFuncionarios:
+    """Agregados do cadastro mantidos a cada inserção, para o relatório custar O(1)"""
+    
+    def __init__(self):
+        self.total = 0
+        self.soma_idade = 0
+        self.idade_min = None
+        self.idade_max = None
+        self.por_turno = np.zeros(len(TURNO_DTYPE.categories), dtype=np.int64)
+    
+    def adicionar(self, idades, turnos) -> None:
+        """Contabiliza funcionários novos (arrays de idades e de turnos)"""
+        idades = np.asarray(idades, dtype=np.int64)
+        if len(idades) == 0:
+            return
+        self.total += len(idades)
+        self.soma_idade += int(idades.sum())
+        menor, maior = int(idades.min()), int(idades.max())
+        self.idade_min = menor if self.idade_min is None else min(self.idade_min, menor)
+        self.idade_max = maior if self.idade_max is None else max(self.idade_max, maior)
+        self.por_turno += np.bincount(TURNO_DTYPE.categories.get_indexer(turnos), minlength=len(self.por_turno))
+    
+    def resumo(self) -> dict:
+        por_turno = pd.Series(self.por_turno, index=TURNO_DTYPE.categories)
+        return {
+            'total': self.total,
+            'por_turno': por_turno[por_turno > 0].sort_values(ascending=False, kind='stable').to_dict(),
+            'idade_media': self.soma_idade / self.total if self.total else None,
+            'idade_min': self.idade_min,
+            'idade_max': self.idade_max
+        }
+
+
+class Armazenamento:
+    """Interface dos backends de armazenamento usados pelo SistemaPonto
+    
+    As validações e mensagens ficam no SistemaPonto; o backend só guarda os dados,
+    mantém seus índices e responde às consultas.
+    """
+    
+    # Backends que já gravam cada operação de forma durável dispensam o DiarioPonto
+    duravel = False
+    
+    # ---- FUNCIONÁRIOS ----
+    
+    def inserir_funcionario(self, matricula: str, nome: str, idade: int, turno: str) -> None:
+        """Insere um funcionário (a matrícula já foi validada)"""
+        raise NotImplementedError
+    
+    def inserir_funcionarios(self, matricula, nome, idade, turno) -> None:
+        """Insere vários funcionários a partir de arrays alinhados"""
+        raise NotImplementedError
+    
+    def obter_funcionario(self, matricula: str) -> tuple:
+        """Retorna (nome, idade, turno) ou None"""
+        raise NotImplementedError
+    
+    def nomes_funcionarios(self, matriculas) -> np.ndarray:
+        """Nome de cada matrícula pedida (None para as inexistentes)"""
+        raise NotImplementedError
+    
+    def funcionarios_df(self) -> pd.DataFrame:
+        """Todos os funcionários como DataFrame"""
+        raise NotImplementedError
+    
+    def estatisticas_funcionarios(self) -> dict:
+        """Total, contagem por turno e idade média/mínima/máxima"""
+        raise NotImplementedError
+    
+    def buscar_funcionarios(self, prefixo: str, limite: int = 10) -> list:
+        """Até `limite` matrículas cujo nome tem palavras começando com os termos do prefixo (sem acentos)"""
+        raise NotImplementedError
+    
+    @property
+    def versao_externa(self) -> int:
+        """Contador que muda quando outro processo grava nos mesmos dados (0 se isso não acontece)"""
+        raise NotImplementedError
+    
+    # ---- REGISTROS DE PONTO ----
+    
+    def inserir_entrada(self, matricula: str, entrada: datetime) -> None:
+        """Abre um turno para a matrícula"""
+        raise NotImplementedError
+    
+    def inserir_entradas(self, matricula, entrada) -> None:
+        """Abre vários turnos a partir de arrays alinhados"""
+        raise NotImplementedError
+    
+    def fechar_saida(self, matricula: str, saida: datetime) -> bool:
+        """Fecha o turno aberto mais antigo da matrícula que começou no mesmo dia da saída
+        
+        Uma saída com hora anterior à da entrada é gravada no dia seguinte.
+        """
+        raise NotImplementedError
+    
+    def fechar_saidas(self, matricula, saida) -> np.ndarray:
+        """Fecha vários turnos em ordem; retorna quais saídas encontraram entrada"""
+        raise NotImplementedError
+    
+    def eventos_funcionario(self, matricula: str, inicio: datetime = None, fim: datetime = None) -> pd.DataFrame:
+        """Registros de ponto (id, matricula, entrada, saida) de uma matrícula, opcionalmente entre duas datas"""
+        raise NotImplementedError
+    
+    def registros_periodo(self, inicio: datetime = None, fim: datetime = None) -> pd.DataFrame:
+        """Registros de ponto com entrada entre as datas inicio e fim (inclusivas)"""
+        raise NotImplementedError
+    
+    def registros_df(self) -> pd.DataFrame:
+        """Todos os registros de ponto (id, matricula, entrada, saida) como DataFrame"""
+        raise NotImplementedError
+    
+    def iterar_registros(self, matricula: str = None, cursor: int = 0, tamanho: int = 1000):
+        """Gera blocos de `tamanho` registros com id > cursor, em ordem de id (o último pode ser menor)"""
+        raise NotImplementedError
+    
+    def iterar_periodo(self, inicio: datetime = None, fim: datetime = None, tamanho: int = 1000):
+        """Gera blocos de até `tamanho` registros com entrada entre as datas inicio e fim (inclusivas)"""
+        raise NotImplementedError
+    
+    def contar_registros(self) -> int:
+        """Quantidade de registros de ponto"""
+        raise NotImplementedError
+    
+    @property
+    def linhas_varridas(self) -> int:
+        """Linhas examinadas pelas consultas desta thread até agora (as métricas usam a diferença)"""
+        raise NotImplementedError
+    
+    def carregar(self, funcionarios: pd.DataFrame, registros: pd.DataFrame) -> None:
+        """Substitui todo o conteúdo pelos DataFrames dados (ex.: um snapshot)"""
+        raise NotImplementedError
+
+
+class ArmazenamentoMemoria(Armazenamento):
+    """Armazenamento em memória: tabelas colunares e índices em dicionários
+    
+    Os registros de ponto ficam em uma TabelaColunar por mês da entrada, e as consultas
+    por período só leem os meses que se sobrepõem ao intervalo.
+    """
+    
+    def __init__(self):
+        self.funcionarios = TabelaColunar({
+            'matricula': object,
+            'nome': object,
+            'idade': np.int16,
+            'turno': TURNO_DTYPE
+        })
+        self.particoes = {}
+        self._localizacao = TabelaColunar({'particao': np.int32, 'posicao': np.int64})
+        self._registros_df = None
+        self._indice_matricula = {}
+        self._indice_matricula_pd = None
+        self._turnos_abertos = {}
+        self._estatisticas = EstatisticasFuncionarios()
+        self._indice_nomes = IndicePrefixo()
+        self._varridas = ContadorVarredura()
+    
+    # ---- FUNCIONÁRIOS ----
+    
+    def inserir_funcionario(self, matricula: str, nome: str, idade: int, turno: str) -> None:
+        # O índice de nomes vem primeiro: é o único passo que pode recusar o nome
+        self._indice_nomes.adicionar([matricula], [nome])
+        posicao = self.funcionarios.anexar(matricula=matricula, nome=nome, idade=idade, turno=turno)
+        self._indice_matricula[matricula] = posicao
+        self._estatisticas.adicionar([idade], [turno])
+    
+    def inserir_funcionarios(self, matricula, nome, idade, turno) -> None:
+        self._indice_nomes.adicionar(matricula, nome)
+        novas = self.funcionarios.estender(matricula=matricula, nome=nome, idade=idade, turno=turno)
+        self._indice_matricula.update(zip(matricula, novas.tolist()))
+        self._estatisticas.adicionar(idade, turno)
+    
+    def obter_funcionario(self, matricula: str) -> tuple:
+        posicao = self._indice_matricula.get(matricula)
+        if posicao is None:
+            return None
+        self._varridas.total += 1
+        return (self.funcionarios.valor(posicao, 'nome'),
+                int(self.funcionarios.valor(posicao, 'idade')),
+                self.funcionarios.valor(posicao, 'turno'))
+    
+    def _posicoes_funcionarios(self, matriculas) -> np.ndarray:
+        """Posições de várias matrículas de uma vez (-1 para as inexistentes)"""
+        if self._indice_matricula_pd is None or self._indice_matricula_pd[0] != self.funcionarios.versao:
+            indice = pd.Index(self.funcionarios.coluna('matricula'))
+            self._indice_matricula_pd = (self.funcionarios.versao, indice)
+        return self._indice_matricula_pd[1].get_indexer(matriculas)
+    
+    def nomes_funcionarios(self, matriculas) -> np.ndarray:
+        posicoes = self._posicoes_funcionarios(matriculas)
+        encontrados = posicoes >= 0
+        self._varridas.total += int(encontrados.sum())
+        nomes = np.full(len(posicoes), None, dtype=object)
+        nomes[encontrados] = self.funcionarios.coluna('nome')[posicoes[encontrados]]
+        return nomes
+    
+    def funcionarios_df(self) -> pd.DataFrame:
+        self._varridas.total += len(self.funcionarios)
+        return self.funcionarios.para_dataframe()
+    
+    def estatisticas_funcionarios(self) -> dict:
+        return self._estatisticas.resumo()
+    
+    def buscar_funcionarios(self, prefixo: str, limite: int = 10) -> list:
+        return self._indice_nomes.buscar(prefixo, limite)
+    
+    @property
+    def versao_externa(self) -> int:
+        return 0
+    
+    # ---- REGISTROS DE PONTO ----
+    
+    def _particao(self, chave: int) -> TabelaColunar:
+        particao = self.particoes.get(chave)
+        if particao is None:
+            particao = self.particoes[chave] = TabelaColunar(COLUNAS_REGISTROS)
+        return particao
+    
+    def _particoes_no_periodo(self, inicio: datetime = None, fim: datetime = None) -> list:
+        """Partições (em ordem de mês) que podem ter entradas no período"""
+        primeiro = -np.inf if inicio is None else int(mes(pd.Timestamp(inicio).normalize()))
+        ultimo = np.inf if fim is None else int(mes(pd.Timestamp(fim).normalize()))
+        return [self.particoes[chave] for chave in sorted(self.particoes) if primeiro <= chave <= ultimo]
+    
+    def _anexar_registros(self, matricula, entrada, saida) -> None:
+        """Distribui linhas novas pelas partições, numera em ordem e abre os turnos sem saída
+        
+        O registro de id k fica na linha k-1 de `_localizacao`, que aponta sua partição e posição.
+        """
+        matricula = np.asarray(matricula, dtype=object)
+        entrada = np.asarray(entrada, dtype='datetime64[ns]')
+        saida = np.asarray(saida, dtype='datetime64[ns]')
+        primeiro = len(self._localizacao) + 1
+        ids = np.arange(primeiro, primeiro + len(matricula))
+        meses = mes(entrada)
+        posicoes = np.empty(len(matricula), dtype=np.int64)
+        for chave in np.unique(meses).tolist():
+            linhas = np.flatnonzero(meses == chave)
+            posicoes[linhas] = self._particao(chave).estender(id=ids[linhas], matricula=matricula[linhas],
+                                                              entrada=entrada[linhas], saida=saida[linhas])
+        self._localizacao.estender(particao=meses, posicao=posicoes)
+        abertos = np.flatnonzero(np.isnat(saida))
+        self._abrir(zip(matricula[abertos], dia(entrada[abertos]).tolist()),
+                    zip(meses[abertos].tolist(), posicoes[abertos].tolist()))
+        self._registros_df = None
+    
+    def _abrir(self, chaves, posicoes) -> None:
+        for chave, posicao in zip(chaves, posicoes):
+            self._turnos_abertos.setdefault(chave, deque()).append(posicao)
+    
+    def inserir_entrada(self, matricula: str, entrada: datetime) -> None:
+        chave = int(mes(entrada))
+        posicao = self._particao(chave).anexar(id=len(self._localizacao) + 1, matricula=matricula,
+                                               entrada=entrada, saida=None)
+        self._localizacao.anexar(particao=chave, posicao=posicao)
+        self._abrir([(matricula, int(dia(entrada)))], [(chave, posicao)])
+        self._registros_df = None
+    
+    def inserir_entradas(self, matricula, entrada) -> None:
+        self._anexar_registros(matricula, entrada, np.full(len(matricula), np.datetime64('NaT'), dtype='datetime64[ns]'))
+    
+    def fechar_saida(self, matricula: str, saida: datetime) -> bool:
+        chave = (matricula, int(dia(saida)))
+        abertos = self._turnos_abertos.get(chave)
+        if not abertos:
+            return False
+        
+        particao, posicao = abertos.popleft()
+        tabela = self.particoes[particao]
+        tabela.atualizar(posicao, 'saida', depois_da_entrada(tabela.valor(posicao, 'entrada'), saida))
+        if not abertos:
+            del self._turnos_abertos[chave]
+        self._registros_df = None
+        return True
+    
+    def fechar_saidas(self, matricula, saida) -> np.ndarray:
+        """Casa a k-ésima saída de cada (matrícula, dia) com o k-ésimo turno aberto via merge"""
+        pedidas = pd.DataFrame({'matricula': matricula, 'dia': dia(saida), 'saida': saida})
+        pedidas['ordem'] = pedidas.groupby(['matricula', 'dia']).cumcount()
+        
+        abertas = [(m, d, ordem, particao, posicao)
+                   for m, d in pedidas[['matricula', 'dia']].drop_duplicates().itertuples(index=False)
+                   for ordem, (particao, posicao) in enumerate(self._turnos_abertos.get((m, d), ()))]
+        abertas = pd.DataFrame(abertas, columns=['matricula', 'dia', 'ordem', 'particao', 'posicao'])
+        
+        casadas = pedidas.merge(abertas, on=['matricula', 'dia', 'ordem'], how='left')
+        fechadas = casadas['posicao'].notna().to_numpy()
+        
+        casadas = casadas[fechadas]
+        for particao, linhas in casadas.groupby('particao'):
+            tabela = self.particoes[int(particao)]
+            posicoes = linhas['posicao'].to_numpy(dtype=np.int64)
+            tabela.atualizar(posicoes, 'saida',
+                             depois_da_entrada(tabela.coluna('entrada')[posicoes], linhas['saida'].to_numpy()))
+        for (m, d), quantidade in casadas.groupby(['matricula', 'dia']).size().items():
+            abertos = self._turnos_abertos[(m, d)]
+            for _ in range(quantidade):
+                abertos.popleft()
+            if not abertos:
+                del self._turnos_abertos[(m, d)]
+        self._registros_df = None
+        return fechadas
+    
+    def _posicoes(self, particao: TabelaColunar, matricula: str = None, inicio: datetime = None,
+                  fim: datetime = None) -> np.ndarray:
+        """Posições da partição com a matrícula e a entrada no período (datas inclusivas)"""
+        self._varridas.total += len(particao)
+        entrada = particao.coluna('entrada')
+        mascara = np.ones(len(particao), dtype=bool)
+        if matricula is not None:
+            mascara &= particao.coluna('matricula') == matricula
+        if inicio is not None:
+            mascara &= entrada >= pd.Timestamp(inicio).normalize().to_datetime64()
+        if fim is not None:
+            mascara &= entrada < (pd.Timestamp(fim).normalize() + pd.Timedelta(days=1)).to_datetime64()
+        return np.flatnonzero(mascara)
+    
+    def _selecionar(self, matricula: str = None, inicio: datetime = None, fim: datetime = None) -> pd.DataFrame:
+        partes = [particao.linhas(self._posicoes(particao, matricula, inicio, fim))
+                  for particao in self._particoes_no_periodo(inicio, fim)]
+        if not partes:
+            return TabelaColunar(COLUNAS_REGISTROS, capacidade=1).para_dataframe()
+        return pd.concat(partes, ignore_index=True)
+    
+    def eventos_funcionario(self, matricula: str, inicio: datetime = None, fim: datetime = None) -> pd.DataFrame:
+        return self._selecionar(matricula, inicio, fim)
+    
+    def registros_periodo(self, inicio: datetime = None, fim: datetime = None) -> pd.DataFrame:
+        return self._selecionar(None, inicio, fim)
+    
+    def registros_df(self) -> pd.DataFrame:
+        if self._registros_df is None:
+            partes = [particao.para_dataframe() for particao in self._particoes_no_periodo()]
+            self._varridas.total += len(self._localizacao)
+            self._registros_df = (pd.concat(partes, ignore_index=True) if partes
+                                  else TabelaColunar(COLUNAS_REGISTROS, capacidade=1).para_dataframe())
+        return self._registros_df
+    
+    def _linhas(self, particoes: np.ndarray, posicoes: np.ndarray) -> pd.DataFrame:
+        """Registros dados por (partição, posição), em ordem de id"""
+        self._varridas.total += len(posicoes)
+        partes = [self.particoes[chave].linhas(posicoes[particoes == chave]) for chave in np.unique(particoes).tolist()]
+        return pd.concat(partes).sort_values('id', ignore_index=True)
+    
+    def _linhas_por_id(self, inicio: int, fim: int) -> pd.DataFrame:
+        """Registros com id em (inicio, fim], em ordem de id"""
+        return self._linhas(self._localizacao.coluna('particao')[inicio:fim],
+                            self._localizacao.coluna('posicao')[inicio:fim])
+    
+    def iterar_registros(self, matricula: str = None, cursor: int = 0, tamanho: int = 1000):
+        if matricula is not None:
+            yield from self._iterar_matricula(matricula, cursor, tamanho)
+            return
+        pendentes, acumulados = [], 0
+        inicio = cursor
+        while inicio < len(self._localizacao):
+            fim = min(inicio + max(tamanho, _JANELA_VARREDURA), len(self._localizacao))
+            bloco = self._linhas_por_id(inicio, fim)
+            pendentes.append(bloco)
+            acumulados += len(bloco)
+            while acumulados >= tamanho:
+                juntos = pd.concat(pendentes, ignore_index=True)
+                yield juntos.iloc[:tamanho]
+                pendentes, acumulados = [juntos.iloc[tamanho:]], len(juntos) - tamanho
+            inicio = fim
+        if acumulados:
+            yield pd.concat(pendentes, ignore_index=True)
+    
+    def _iterar_matricula(self, matricula: str, cursor: int, tamanho: int):
+        """Filtra cada partição pela matrícula com _posicoes e pagina só essas linhas por id"""
+        chaves, posicoes, ids = [], [], []
+        for chave, particao in self.particoes.items():
+            achadas = self._posicoes(particao, matricula)
+            id_achadas = particao.coluna('id')[achadas]
+            depois = id_achadas > cursor
+            chaves.append(np.full(depois.sum(), chave, dtype=np.int32))
+            posicoes.append(achadas[depois])
+            ids.append(id_achadas[depois])
+        if not ids:
+            return
+        ordem = np.argsort(np.concatenate(ids), kind='stable')
+        chaves, posicoes = np.concatenate(chaves)[ordem], np.concatenate(posicoes)[ordem]
+        for comeco in range(0, len(ordem), tamanho):
+            yield self._linhas(chaves[comeco:comeco + tamanho], posicoes[comeco:comeco + tamanho])
+    
+    def iterar_periodo(self, inicio: datetime = None, fim: datetime = None, tamanho: int = 1000):
+        for particao in self._particoes_no_periodo(inicio, fim):
+            posicoes = self._posicoes(particao, None, inicio, fim)
+            for comeco in range(0, len(posicoes), tamanho):
+                yield particao.linhas(posicoes[comeco:comeco + tamanho]).reset_index(drop=True)
+    
+    def contar_registros(self) -> int:
+        return len(self._localizacao)
+    
+    @property
+    def linhas_varridas(self) -> int:
+        return self._varridas.total
+    
+    def carregar(self, funcionarios: pd.DataFrame, registros: pd.DataFrame) -> None:
+        varridas = self._varridas
+        self.__init__()
+        self._varridas = varridas
+        self.inserir_funcionarios(*(funcionarios[c].to_numpy() for c in ['matricula', 'nome', 'idade', 'turno']))
+        if 'id' in registros:
+            registros = registros.sort_values('id')
+        self._anexar_registros(registros['matricula'].to_numpy(), registros['entrada'].to_numpy(),
+                               registros['saida'].to_numpy())
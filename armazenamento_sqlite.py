@@ -0,0 +1,197 @@
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from armazenamento import Armazenamento, ContadorVarredura, TURNO_DTYPE
+from esquema_sqlite import (SQL_INSERIR_FUNCIONARIO, SQL_OBTER_FUNCIONARIO, SQL_INSERIR_ENTRADA,
+                            SQL_FECHAR_SAIDA, SQL_REGISTROS, SQL_INSERIR_TOKEN,
+                            conectar, segundos, dia_em_segundos, buscar_nomes)
+from indices import tokens_nome
+
+
+_LOTE_CONSULTA = 500
+
+
+def _segundos(instante) -> int:
+    return segundos(pd.Timestamp(instante).to_pydatetime())
+
+
+def _dia_em_segundos(instante) -> tuple:
+    """Início e fim (exclusivo) do dia do instante, em segundos"""
+    return dia_em_segundos(pd.Timestamp(instante).to_pydatetime())
+
+
+def _filtro_periodo(inicio: datetime = None, fim: datetime = None) -> tuple:
+    """Condições SQL e parâmetros para entrada entre as datas inicio e fim (inclusivas)"""
+    condicoes, parametros = [], []
+    if inicio is not None:
+        condicoes.append("entrada >= ?")
+        parametros.append(_dia_em_segundos(inicio)[0])
+    if fim is not None:
+        condicoes.append("entrada < ?")
+        parametros.append(_dia_em_segundos(fim)[1])
+    return condicoes, parametros
+
+
+def _tipar_registros(df: pd.DataFrame) -> pd.DataFrame:
+    df['entrada'] = pd.to_datetime(df['entrada'], unit='s')
+    df['saida'] = pd.to_datetime(df['saida'], unit='s')
+    return df
+
+
+class ArmazenamentoSQLite(Armazenamento):
+    """Armazenamento persistente em SQLite (WAL, índices por matrícula e data)"""
+    
+    duravel = True
+    
+    def __init__(self, caminho: str = 'ponto.db'):
+        self.caminho = caminho
+        self._conexao = conectar(caminho)
+        self._varridas = ContadorVarredura()
+        sem_indice = self._conexao.execute(
+            "SELECT EXISTS (SELECT 1 FROM funcionarios) AND NOT EXISTS (SELECT 1 FROM nomes_funcionarios)").fetchone()[0]
+        if sem_indice:
+            # Banco criado antes do índice de nomes
+            with self._conexao:
+                self._indexar_nomes(self._conexao.execute("SELECT matricula, nome FROM funcionarios").fetchall())
+    
+    def fechar(self) -> None:
+        """Fecha a conexão com o banco"""
+        self._conexao.close()
+    
+    # ---- FUNCIONÁRIOS ----
+    
+    def _indexar_nomes(self, funcionarios) -> None:
+        self._conexao.executemany(SQL_INSERIR_TOKEN, ((token, matricula) for matricula, nome in funcionarios
+                                                      for token in tokens_nome(nome)))
+    
+    def inserir_funcionario(self, matricula: str, nome: str, idade: int, turno: str) -> None:
+        with self._conexao:
+            self._conexao.execute(SQL_INSERIR_FUNCIONARIO, (matricula, nome, int(idade), turno))
+            self._indexar_nomes([(matricula, nome)])
+    
+    def inserir_funcionarios(self, matricula, nome, idade, turno) -> None:
+        with self._conexao:
+            self._conexao.executemany(SQL_INSERIR_FUNCIONARIO,
+                                      zip(matricula, nome, (int(i) for i in idade), turno))
+            self._indexar_nomes(zip(matricula, nome))
+    
+    def buscar_funcionarios(self, prefixo: str, limite: int = 10) -> list:
+        return buscar_nomes(self._conexao, prefixo, limite)
+    
+    def obter_funcionario(self, matricula: str) -> tuple:
+        funcionario = self._conexao.execute(SQL_OBTER_FUNCIONARIO, (matricula,)).fetchone()
+        self._varridas.total += funcionario is not None
+        return funcionario
+    
+    def nomes_funcionarios(self, matriculas) -> np.ndarray:
+        matriculas = list(matriculas)
+        encontrados = {}
+        for inicio in range(0, len(matriculas), _LOTE_CONSULTA):
+            parte = matriculas[inicio:inicio + _LOTE_CONSULTA]
+            sql = f"SELECT matricula, nome FROM funcionarios WHERE matricula IN ({', '.join('?' * len(parte))})"
+            linhas = self._conexao.execute(sql, parte).fetchall()
+            self._varridas.total += len(linhas)
+            encontrados.update(linhas)
+        return np.array([encontrados.get(m) for m in matriculas], dtype=object)
+    
+    def funcionarios_df(self) -> pd.DataFrame:
+        df = pd.read_sql_query("SELECT matricula, nome, idade, turno FROM funcionarios ORDER BY rowid",
+                               self._conexao)
+        df['turno'] = df['turno'].astype(TURNO_DTYPE)
+        self._varridas.total += len(df)
+        return df
+    
+    def estatisticas_funcionarios(self) -> dict:
+        total, media, minima, maxima = self._conexao.execute(
+            "SELECT COUNT(*), AVG(idade), MIN(idade), MAX(idade) FROM funcionarios").fetchone()
+        por_turno = self._conexao.execute(
+            "SELECT turno, COUNT(*) AS n FROM funcionarios GROUP BY turno ORDER BY n DESC").fetchall()
+        self._varridas.total += 2 * total  # as duas agregações percorrem a tabela inteira
+        return {
+            'total': total,
+            'por_turno': dict(por_turno),
+            'idade_media': media,
+            'idade_min': minima,
+            'idade_max': maxima
+        }
+    
+    @property
+    def versao_externa(self) -> int:
+        # data_version muda quando outra conexão (ex.: o quiosque) grava no banco
+        return self._conexao.execute("PRAGMA data_version").fetchone()[0]
+    
+    # ---- REGISTROS DE PONTO ----
+    
+    def inserir_entrada(self, matricula: str, entrada: datetime) -> None:
+        with self._conexao:
+            self._conexao.execute(SQL_INSERIR_ENTRADA, (matricula, _segundos(entrada)))
+    
+    def inserir_entradas(self, matricula, entrada) -> None:
+        segundos = np.asarray(entrada, dtype='datetime64[s]').astype(np.int64)
+        with self._conexao:
+            self._conexao.executemany(SQL_INSERIR_ENTRADA, zip(matricula, segundos.tolist()))
+    
+    def fechar_saida(self, matricula: str, saida: datetime) -> bool:
+        with self._conexao:
+            return self._conexao.execute(
+                SQL_FECHAR_SAIDA, (_segundos(saida), matricula, *_dia_em_segundos(saida))).rowcount == 1
+    
+    def fechar_saidas(self, matricula, saida) -> np.ndarray:
+        with self._conexao:
+            return np.array([self._conexao.execute(
+                                 SQL_FECHAR_SAIDA, (_segundos(s), m, *_dia_em_segundos(s))).rowcount == 1
+                             for m, s in zip(matricula, saida)], dtype=bool)
+    
+    def _consultar_registros(self, condicoes: list, parametros: list) -> pd.DataFrame:
+        sql = SQL_REGISTROS + (" WHERE " + " AND ".join(condicoes) if condicoes else "") + " ORDER BY id"
+        registros = pd.read_sql_query(sql, self._conexao, params=parametros)
+        self._varridas.total += len(registros)
+        return _tipar_registros(registros)
+    
+    def eventos_funcionario(self, matricula: str, inicio: datetime = None, fim: datetime = None) -> pd.DataFrame:
+        condicoes, parametros = _filtro_periodo(inicio, fim)
+        return self._consultar_registros(["matricula = ?"] + condicoes, [matricula] + parametros)
+    
+    def registros_periodo(self, inicio: datetime = None, fim: datetime = None) -> pd.DataFrame:
+        return self._consultar_registros(*_filtro_periodo(inicio, fim))
+    
+    def registros_df(self) -> pd.DataFrame:
+        return self._consultar_registros([], [])
+    
+    def iterar_registros(self, matricula: str = None, cursor: int = 0, tamanho: int = 1000):
+        condicoes = ["id > ?"] + (["matricula = ?"] if matricula is not None else [])
+        sql = SQL_REGISTROS + " WHERE " + " AND ".join(condicoes) + " ORDER BY id LIMIT ?"
+        while True:
+            parametros = [cursor] + ([matricula] if matricula is not None else []) + [tamanho]
+            bloco = _tipar_registros(pd.read_sql_query(sql, self._conexao, params=parametros))
+            self._varridas.total += len(bloco)
+            if bloco.empty:
+                return
+            yield bloco
+            if len(bloco) < tamanho:
+                return
+            cursor = int(bloco['id'].iloc[-1])
+    
+    def iterar_periodo(self, inicio: datetime = None, fim: datetime = None, tamanho: int = 1000):
+        condicoes, parametros = _filtro_periodo(inicio, fim)
+        sql = (SQL_REGISTROS + " WHERE " + " AND ".join(condicoes + ["(entrada > ? OR (entrada = ? AND id > ?))"])
+               + " ORDER BY entrada, id LIMIT ?")
+        entrada, ultimo = -2 ** 62, 0
+        while True:
+            bloco = pd.read_sql_query(sql, self._conexao, params=parametros + [entrada, entrada, ultimo, tamanho])
+            self._varridas.total += len(bloco)
+            if bloco.empty:
+                return
+            entrada, ultimo = int(bloco['entrada'].iloc[-1]), int(bloco['id'].iloc[-1])
+            yield _tipar_registros(bloco)
+            if len(bloco) < tamanho:
+                return
+    
+    def contar_registros(self) -> int:
+        total = self._conexao.execute("SELECT COUNT(*) FROM registros").fetchone()[0]
+        self._varridas.total += total  # COUNT(*) percorre um índice inteiro
+        return total
+    
+    @property
+    def linhas_varridas(self) -> int:
+        return self._varridas.total
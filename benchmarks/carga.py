@@ -0,0 +1,125 @@
+"""Benchmark de carga do SistemaPonto com dados sintéticos
+
+Uso: python benchmarks/carga.py [--tamanhos 100 1000 5000] [--dias 20] [--backend memoria|sqlite]
+                                [--semente 0] [--saida resultados_carga.json]
+Para cada tamanho (número de funcionários) mede vazão e latência p50/p99 das
+operações principais e grava tudo em JSON, para comparar entre versões.
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from io import BytesIO
+
+import numpy as np
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from sistema import SistemaPonto
+from armazenamento_sqlite import ArmazenamentoSQLite
+from dados import dados_sinteticos
+from enums import TipoEvento
+
+_TIPOS = {t.value: t for t in TipoEvento}
+
+
+def medir(chamadas) -> dict:
+    """Executa cada chamada sem argumentos e resume os tempos"""
+    tempos = []
+    inicio = time.perf_counter()
+    for chamada in chamadas:
+        antes = time.perf_counter()
+        chamada()
+        tempos.append(time.perf_counter() - antes)
+    total = time.perf_counter() - inicio
+    tempos = np.array(tempos) * 1000
+    return {
+        'chamadas': len(tempos),
+        'total_s': round(total, 4),
+        'vazao_por_s': round(len(tempos) / total, 1) if total else None,
+        'p50_ms': round(float(np.percentile(tempos, 50)), 4),
+        'p99_ms': round(float(np.percentile(tempos, 99)), 4)
+    }
+
+
+def rodar(tamanho: int, dias: int, semente: int, backend: str, pasta: str) -> dict:
+    funcionarios, eventos = dados_sinteticos(tamanho, dias, semente)
+    armazenamento = ArmazenamentoSQLite(os.path.join(pasta, f"carga-{tamanho}.db")) if backend == 'sqlite' else None
+    sistema = SistemaPonto(armazenamento)
+    rng = np.random.default_rng(semente)
+    amostra = rng.choice(funcionarios['matricula'].to_numpy(), min(200, tamanho), replace=False)
+    
+    resultados = {'eventos': len(eventos)}
+    with open(os.devnull, 'w') as nulo, contextlib.redirect_stdout(nulo):
+        resultados['cadastrar_funcionario'] = medir(
+            (lambda f=f: sistema.cadastrar_funcionario(*f)) for f in funcionarios.itertuples(index=False))
+        resultados['registrar_evento'] = medir(
+            (lambda e=e: sistema.registrar_evento(e.matricula, _TIPOS[e.tipo], e.data, e.hora))
+            for e in eventos.itertuples(index=False))
+        resultados['consultar_eventos'] = medir((lambda m=m: sistema.consultar_eventos(m)) for m in amostra)
+        resultados['consultar_eventos_cache'] = medir((lambda m=m: sistema.consultar_eventos(m)) for m in amostra)
+        resultados['gerar_relatorio_completo'] = medir(
+            (lambda: (sistema.cache.limpar(), sistema.gerar_relatorio_completo())) for _ in range(5))
+        resultados['gerar_relatorio_completo_cache'] = medir(sistema.gerar_relatorio_completo for _ in range(20))
+        for grafico in ('grafico_barras_idade', 'grafico_pizza_turno'):
+            metodo = getattr(sistema, grafico)
+            resultados[grafico] = medir(
+                (lambda: (sistema.cache.limpar(), metodo(BytesIO()))) for _ in range(3))
+            resultados[grafico + '_cache'] = medir((lambda: metodo(BytesIO())) for _ in range(20))
+        resultados['cache'] = sistema.cache.estatisticas()
+    if armazenamento is not None:
+        armazenamento.fechar()
+    return resultados
+
+
+def versao_codigo() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=RAIZ, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=[100, 1000, 5000])
+    parser.add_argument('--dias', type=int, default=20)
+    parser.add_argument('--backend', choices=['memoria', 'sqlite'], default='memoria')
+    parser.add_argument('--semente', type=int, default=0)
+    parser.add_argument('--saida', default='resultados_carga.json')
+    args = parser.parse_args()
+    
+    relatorio = {
+        'versao': versao_codigo(),
+        'data': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'parametros': vars(args),
+        'resultados': {}
+    }
+    with tempfile.TemporaryDirectory() as pasta:
+        for tamanho in args.tamanhos:
+            print(f"⏱️  {tamanho} funcionários x {args.dias} dias ({args.backend})...")
+            resultados = rodar(tamanho, args.dias, args.semente, args.backend, pasta)
+            relatorio['resultados'][str(tamanho)] = resultados
+            cache = resultados.pop('cache')
+            for operacao, medidas in resultados.items():
+                if isinstance(medidas, dict):
+                    print(f"   {operacao:<32} {medidas['vazao_por_s']:>12} op/s"
+                          f"   p50 {medidas['p50_ms']:>9.3f} ms   p99 {medidas['p99_ms']:>9.3f} ms")
+            print(f"   cache: {cache['acertos']} acertos, {cache['faltas']} faltas")
+            resultados['cache'] = cache
+    
+    with open(args.saida, 'w', encoding='utf-8') as arquivo:
+        json.dump(relatorio, arquivo, indent=2, ensure_ascii=False)
+    print(f"✅ Resultados gravados em {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
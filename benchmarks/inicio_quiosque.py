@@ -0,0 +1,73 @@
+"""Mede o tempo de partida do quiosque (processo novo até a primeira batida de ponto)
+
+Uso: python benchmarks/inicio_quiosque.py [--repeticoes 15] [--limite-ms 100]
+Sai com código 1 se a mediana passar do limite ou se o quiosque carregar
+pandas, numpy ou matplotlib, e se o sistema carregar o matplotlib sem gráfico.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from esquema_sqlite import SQL_INSERIR_FUNCIONARIO, conectar
+
+BATIDA = """
+import sys
+from quiosque import Quiosque
+quiosque = Quiosque(sys.argv[1])
+quiosque.registrar_entrada('001')
+quiosque.fechar()
+pesados = [m for m in ('pandas', 'numpy', 'matplotlib') if m in sys.modules]
+sys.exit(f"módulos pesados carregados: {pesados}" if pesados else 0)
+"""
+
+SISTEMA = """
+import sys
+import sistema
+sys.exit("matplotlib carregado sem gráfico" if 'matplotlib' in sys.modules else 0)
+"""
+
+
+def executar(codigo: str, *argumentos) -> float:
+    """Roda o código em um interpretador novo e retorna o tempo de parede em ms"""
+    inicio = time.perf_counter()
+    resultado = subprocess.run([sys.executable, '-c', codigo, *argumentos], cwd=RAIZ,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    decorrido = (time.perf_counter() - inicio) * 1000
+    if resultado.returncode != 0:
+        sys.exit(f"❌ {resultado.stderr.strip()}")
+    return decorrido
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeticoes', type=int, default=15)
+    parser.add_argument('--limite-ms', type=float, default=100.0)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, 'ponto.db')
+        conexao = conectar(caminho)
+        with conexao:
+            conexao.execute(SQL_INSERIR_FUNCIONARIO, ('001', 'João Silva', 30, 'matutino'))
+        conexao.close()
+        
+        executar(BATIDA, caminho)
+        tempos = [executar(BATIDA, caminho) for _ in range(args.repeticoes)]
+    executar(SISTEMA)
+    
+    mediana = statistics.median(tempos)
+    print(f"Quiosque: mediana {mediana:.1f} ms, mínimo {min(tempos):.1f} ms, máximo {max(tempos):.1f} ms")
+    if mediana > args.limite_ms:
+        sys.exit(f"❌ Partida acima do limite de {args.limite_ms:.0f} ms")
+    print(f"✅ Dentro do limite de {args.limite_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import threading
+from collections import OrderedDict
+
+
+class CacheConsultas:
+    """Cache LRU de resultados de consultas, invalidado por contadores de versão
+    
+    Cada tabela e cada matrícula tem um contador que as escritas incrementam. Um resultado
+    guarda as versões do que leu quando foi calculado e só é reaproveitado enquanto elas não mudam.
+    """
+    
+    def __init__(self, capacidade: int = 256):
+        self.capacidade = capacidade
+        self.acertos = 0
+        self.faltas = 0
+        self._itens = OrderedDict()
+        self._versoes = {}
+        self._trava = threading.Lock()
+    
+    def invalidar(self, dependencias) -> None:
+        """Incrementa a versão de cada tabela/matrícula escrita"""
+        with self._trava:
+            for dependencia in dependencias:
+                self._versoes[dependencia] = self._versoes.get(dependencia, 0) + 1
+    
+    def obter(self, chave, dependencias, calcular, externa: int = 0):
+        """Resultado guardado em `chave` se nenhuma dependência mudou; senão chama calcular() e guarda
+        
+        `externa` entra no carimbo junto com as versões (ex.: escritas de outro processo no banco).
+        """
+        with self._trava:
+            carimbo = (externa, *(self._versoes.get(d, 0) for d in dependencias))
+            guardado = self._itens.get(chave)
+            if guardado is not None and guardado[0] == carimbo:
+                self._itens.move_to_end(chave)
+                self.acertos += 1
+                return guardado[1]
+            self.faltas += 1
+        
+        # Calcula fora da trava; uma escrita no meio muda a versão e o resultado já nasce vencido
+        valor = calcular()
+        with self._trava:
+            self._itens[chave] = (carimbo, valor)
+            self._itens.move_to_end(chave)
+            while len(self._itens) > self.capacidade:
+                self._itens.popitem(last=False)
+        return valor
+    
+    def limpar(self) -> None:
+        """Descarta os resultados guardados (as versões continuam valendo)"""
+        with self._trava:
+            self._itens.clear()
+    
+    def estatisticas(self) -> dict:
+        consultas = self.acertos + self.faltas
+        return {
+            'acertos': self.acertos,
+            'faltas': self.faltas,
+            'taxa_acerto': self.acertos / consultas if consultas else 0.0,
+            'itens': len(self._itens),
+            'capacidade': self.capacidade
+        }
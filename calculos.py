@@ -0,0 +1,161 @@
+import json
+import os
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from enums import Turno, TipoAnomalia
+
+
+_UM_DIA = pd.Timedelta(days=1)
+_UMA_HORA = pd.Timedelta(hours=1)
+DURACAO_MAXIMA = pd.Timedelta(hours=16)
+COLUNAS_ANOMALIAS = ['id', 'matricula', 'entrada', 'saida', 'anomalia', 'conflito']
+
+
+def no_periodo(entradas: pd.Series, inicio: datetime = None, fim: datetime = None) -> np.ndarray:
+    """Máscara das entradas entre as datas inicio e fim (inclusivas; None deixa o lado aberto)"""
+    mascara = np.ones(len(entradas), dtype=bool)
+    if inicio is not None:
+        mascara &= (entradas >= pd.Timestamp(inicio).normalize()).to_numpy()
+    if fim is not None:
+        mascara &= (entradas < pd.Timestamp(fim).normalize() + _UM_DIA).to_numpy()
+    return mascara
+
+
+def duracao_turnos(registros: pd.DataFrame, noturno: np.ndarray) -> pd.Series:
+    """Duração de cada turno; saída antes da entrada vira meia-noite no noturno e NaT nos demais
+    
+    O armazenamento já grava a saída no dia seguinte; a virada aqui cobre bancos mais antigos.
+    """
+    duracao = registros['saida'] - registros['entrada']
+    virada = noturno & (duracao < pd.Timedelta(0)).to_numpy()
+    duracao = duracao.where(~virada, duracao + _UM_DIA)
+    return duracao.where(duracao >= pd.Timedelta(0))
+
+
+def horas_por_matricula(registros: pd.DataFrame, funcionarios: pd.DataFrame,
+                        inicio: datetime = None, fim: datetime = None) -> pd.DataFrame:
+    """Horas trabalhadas e turnos fechados de cada funcionário no período, em uma passada
+    
+    `registros` tem matricula/entrada/saida e `funcionarios` tem matricula/turno; o
+    resultado traz uma linha por funcionário (zeros para quem não trabalhou).
+    Turnos ainda abertos não entram na conta.
+    """
+    turnos = pd.Series(np.asarray(funcionarios['turno'], dtype=object), index=funcionarios['matricula'])
+    fechados = registros[no_periodo(registros['entrada'], inicio, fim) & registros['saida'].notna().to_numpy()]
+    noturno = (fechados['matricula'].map(turnos) == Turno.NOTURNO.value).to_numpy()
+    horas = duracao_turnos(fechados, noturno) / _UMA_HORA
+    
+    resumo = pd.DataFrame({'matricula': fechados['matricula'].to_numpy(), 'horas': horas.to_numpy()})
+    resumo = resumo.groupby('matricula', sort=False)['horas'].agg(horas='sum', turnos='count')
+    resumo = resumo.reindex(turnos.index, fill_value=0)
+    resumo['turnos'] = resumo['turnos'].astype(np.int64)
+    return resumo.rename_axis('matricula').reset_index()
+
+
+def detectar_anomalias(registros: pd.DataFrame, funcionarios: pd.DataFrame, hoje: datetime = None) -> pd.DataFrame:
+    """Problemas nos registros, encontrados ordenando por matrícula/entrada e comparando vizinhos
+    
+    - SEM_SAIDA: turno aberto com entrada antes de hoje
+    - ENTRADA_DUPLICADA: mesma entrada da anterior, ou outra entrada no dia com a anterior ainda aberta
+    - SOBREPOSICAO: entrada antes do fim de algum turno anterior do funcionário
+    - DURACAO_IMPOSSIVEL: saída que não fecha um turno de até DURACAO_MAXIMA
+    
+    Retorna uma linha por (registro, anomalia); `conflito` é o id do registro anterior envolvido.
+    """
+    hoje = pd.Timestamp(hoje or datetime.now()).normalize()
+    turnos = pd.Series(np.asarray(funcionarios['turno'], dtype=object), index=funcionarios['matricula'])
+    ordem = registros.sort_values(['matricula', 'entrada', 'id'], kind='stable', ignore_index=True)
+    ids = ordem['id'].to_numpy()
+    matricula = ordem['matricula'].to_numpy()
+    entrada = ordem['entrada'].to_numpy(dtype='datetime64[ns]')
+    aberta = ordem['saida'].isna().to_numpy()
+    noturno = (ordem['matricula'].map(turnos) == Turno.NOTURNO.value).to_numpy()
+    duracao = duracao_turnos(ordem, noturno)
+    fim = (ordem['entrada'] + duracao).to_numpy(dtype='datetime64[ns]')
+    
+    mesmo = np.r_[False, matricula[1:] == matricula[:-1]]
+    anterior = np.maximum(np.arange(len(ordem)) - 1, 0)
+    sem_saida = aberta & (entrada < hoje.to_datetime64())
+    impossivel = ~aberta & (duracao.isna() | (duracao <= pd.Timedelta(0)) | (duracao > DURACAO_MAXIMA)).to_numpy()
+    mesmo_dia = entrada.astype('datetime64[D]') == entrada[anterior].astype('datetime64[D]')
+    duplicada = mesmo & ((entrada == entrada[anterior]) | (aberta[anterior] & mesmo_dia))
+    
+    # Maior fim visto até cada linha dentro da matrícula e a linha que o definiu
+    maximo = pd.Series(fim).groupby(matricula, sort=False).cummax().to_numpy(dtype='datetime64[ns]')
+    dono = np.maximum.accumulate(np.where(~mesmo | (fim == maximo), np.arange(len(ordem)), -1))
+    sobreposta = mesmo & ~duplicada & (entrada < maximo[anterior])
+    
+    partes = []
+    for tipo, mascara, conflito in ((TipoAnomalia.SEM_SAIDA, sem_saida, None),
+                                    (TipoAnomalia.ENTRADA_DUPLICADA, duplicada, anterior),
+                                    (TipoAnomalia.SOBREPOSICAO, sobreposta, dono[anterior]),
+                                    (TipoAnomalia.DURACAO_IMPOSSIVEL, impossivel, None)):
+        linhas = np.flatnonzero(mascara)
+        parte = ordem.iloc[linhas][['id', 'matricula', 'entrada', 'saida']]
+        parte['anomalia'] = tipo.value
+        parte['conflito'] = pd.array(ids[conflito[linhas]] if conflito is not None else [None] * len(linhas),
+                                     dtype='Int64')
+        partes.append(parte)
+    return pd.concat(partes, ignore_index=True).sort_values(['id', 'anomalia'], ignore_index=True)
+
+
+class VerificadorAnomalias:
+    """Verificação incremental de anomalias, para rodar periodicamente em históricos grandes
+    
+    Cada execução olha só os registros com id acima da marca d'água e os que estavam
+    abertos e ainda dentro do dia na execução anterior, comparando-os com os vizinhos
+    do mesmo funcionário em uma janela de um dia. Com `arquivo`, a marca sobrevive entre processos.
+    """
+    
+    def __init__(self, armazenamento: 'Armazenamento', arquivo: str = None, tamanho_bloco: int = 100_000):
+        self.armazenamento = armazenamento
+        self.arquivo = arquivo
+        self.tamanho_bloco = tamanho_bloco
+        self.ultimo_id = 0
+        self._abertos = {}
+        if arquivo and os.path.exists(arquivo):
+            with open(arquivo, encoding='utf-8') as entrada:
+                estado = json.load(entrada)
+            self.ultimo_id = estado['ultimo_id']
+            self._abertos = {int(i): (m, pd.Timestamp(e)) for i, (m, e) in estado['abertos'].items()}
+    
+    def _salvar(self) -> None:
+        temporario = self.arquivo + '.tmp'
+        with open(temporario, 'w', encoding='utf-8') as saida:
+            json.dump({'ultimo_id': self.ultimo_id,
+                       'abertos': {i: [m, e.isoformat()] for i, (m, e) in self._abertos.items()}}, saida)
+        os.replace(temporario, self.arquivo)
+    
+    def _verificar_bloco(self, bloco: pd.DataFrame, funcionarios: pd.DataFrame, hoje: pd.Timestamp) -> pd.DataFrame:
+        """Anomalias que envolvem o bloco (ou só os abertos pendentes, se o bloco for None)"""
+        examinados = [] if bloco is None else [bloco[['id', 'matricula', 'entrada']]]
+        if self._abertos:
+            examinados.append(pd.DataFrame([(i, m, e) for i, (m, e) in self._abertos.items()],
+                                           columns=['id', 'matricula', 'entrada']))
+        examinados = pd.concat(examinados, ignore_index=True)
+        contexto = self.armazenamento.registros_periodo(examinados['entrada'].min() - _UM_DIA,
+                                                        examinados['entrada'].max() + _UM_DIA)
+        contexto = contexto[contexto['matricula'].isin(examinados['matricula'].unique())]
+        anomalias = detectar_anomalias(contexto, funcionarios, hoje)
+        
+        ids = examinados['id'].to_numpy()
+        revistos = contexto[contexto['id'].isin(ids)]
+        pendentes = revistos[revistos['saida'].isna() & (revistos['entrada'] >= hoje)]
+        self._abertos = dict(zip(pendentes['id'].tolist(), zip(pendentes['matricula'], pendentes['entrada'])))
+        if bloco is not None:
+            self.ultimo_id = max(self.ultimo_id, int(bloco['id'].max()))
+        return anomalias[anomalias['id'].isin(ids).to_numpy() | anomalias['conflito'].isin(ids).to_numpy(dtype=bool)]
+    
+    def verificar(self, funcionarios: pd.DataFrame, hoje: datetime = None) -> pd.DataFrame:
+        """Anomalias nos registros novos desde a última execução (as já informadas não se repetem)"""
+        hoje = pd.Timestamp(hoje or datetime.now()).normalize()
+        partes = [self._verificar_bloco(bloco, funcionarios, hoje)
+                  for bloco in self.armazenamento.iterar_registros(None, self.ultimo_id, self.tamanho_bloco)]
+        if not partes and self._abertos:
+            partes.append(self._verificar_bloco(None, funcionarios, hoje))
+        if self.arquivo:
+            self._salvar()
+        if not partes:
+            return pd.DataFrame(columns=COLUNAS_ANOMALIAS)
+        return pd.concat(partes).drop_duplicates(['id', 'anomalia']).sort_values(['id', 'anomalia'], ignore_index=True)
@@ -1,5 +1,8 @@
+from datetime import datetime, timedelta
+import numpy as np
+import pandas as pd
 from sistema import SistemaPonto
-from enums import TipoEvento
+from enums import Turno, TipoEvento
 
 
 def dados_exemplo(sistema: SistemaPonto) -> None:
@@ -16,3 +19,55 @@ def dados_exemplo(sistema: SistemaPonto) -> None:
     sistema.registrar_evento('002', TipoEvento.SAIDA, '28/11/2025', '22:00')
     
     print("✅ Dados de exemplo carregados!\n")
+
+
+_NOMES = ['Ana', 'Bruno', 'Carla', 'Diego', 'Elisa', 'Fábio', 'Gabriela', 'Hugo', 'Isabel', 'João',
+          'Larissa', 'Marcos', 'Natália', 'Otávio', 'Paula', 'Rafael', 'Sofia', 'Tiago', 'Vitória', 'Wagner']
+_SOBRENOMES = ['Silva', 'Santos', 'Oliveira', 'Souza', 'Costa', 'Pereira', 'Almeida', 'Ferreira',
+               'Rodrigues', 'Gomes', 'Martins', 'Araújo', 'Ribeiro', 'Carvalho', 'Lima', 'Barbosa']
+# Horário típico (minutos do dia) de entrada e saída de cada turno; a saída do noturno
+# cai na madrugada e é registrada com a data da entrada, como o sistema espera.
+_HORARIOS_TURNO = {
+    Turno.MATUTINO.value: (8 * 60, 17 * 60),
+    Turno.VESPERTINO.value: (13 * 60, 22 * 60),
+    Turno.NOTURNO.value: (22 * 60, 6 * 60)
+}
+
+
+def dados_sinteticos(funcionarios: int, dias: int, semente: int = 0, inicio: datetime = datetime(2025, 1, 6),
+                     taxa_sem_saida: float = 0.03, taxa_falta: float = 0.05) -> tuple:
+    """Gera (funcionarios_df, eventos_df) reprodutíveis para testes de carga
+    
+    Os funcionários se dividem entre todos os turnos; cada um bate ponto nos dias úteis
+    a partir de `inicio`, com variação de alguns minutos, faltas ocasionais e algumas
+    saídas esquecidas. Os eventos (matricula, tipo, data, hora) vêm na ordem de registro.
+    """
+    rng = np.random.default_rng(semente)
+    turnos = np.array([t.value for t in Turno])
+    cadastro = pd.DataFrame({
+        'matricula': [f"{i:06d}" for i in range(1, funcionarios + 1)],
+        'nome': [f"{n} {s}" for n, s in zip(rng.choice(_NOMES, funcionarios), rng.choice(_SOBRENOMES, funcionarios))],
+        'idade': rng.integers(18, 66, funcionarios),
+        'turno': turnos[rng.permutation(np.arange(funcionarios) % len(turnos))]
+    })
+    
+    datas = [d for d in (inicio + timedelta(days=i) for i in range(dias * 7 // 5 + 7)) if d.weekday() < 5][:dias]
+    matriculas = np.tile(cadastro['matricula'].to_numpy(), len(datas))
+    turno = np.tile(cadastro['turno'].to_numpy(), len(datas))
+    data = np.repeat([d.strftime('%d/%m/%Y') for d in datas], funcionarios)
+    presentes = rng.random(len(matriculas)) >= taxa_falta
+    matriculas, turno, data = matriculas[presentes], turno[presentes], data[presentes]
+    
+    base = np.array([_HORARIOS_TURNO[t] for t in turno]).reshape(-1, 2)
+    minutos = (base + rng.normal(0, 10, base.shape).round().astype(int)) % (24 * 60)
+    horas = np.char.add(np.char.add(np.char.zfill((minutos // 60).astype(str), 2), ':'),
+                        np.char.zfill((minutos % 60).astype(str), 2))
+    
+    eventos = pd.DataFrame({
+        'matricula': np.repeat(matriculas, 2),
+        'tipo': np.tile([TipoEvento.ENTRADA.value, TipoEvento.SAIDA.value], len(matriculas)),
+        'data': np.repeat(data, 2),
+        'hora': horas.reshape(-1)
+    })
+    sem_saida = np.flatnonzero(rng.random(len(matriculas)) < taxa_sem_saida) * 2 + 1
+    return cadastro, eventos.drop(index=sem_saida).reset_index(drop=True)
@@ -0,0 +1,162 @@
+import json
+import os
+import shutil
+from datetime import datetime
+import pandas as pd
+
+
+class DiarioPonto:
+    """Diário append-only das operações de escrita, com snapshots periódicos em Parquet
+    
+    Cada cadastro ou evento de ponto vira uma linha JSON compacta com número de
+    sequência. De tempos em tempos o estado inteiro é gravado como snapshot e o
+    diário recomeça; na inicialização basta carregar o snapshot e reaplicar as
+    linhas posteriores a ele.
+    """
+    
+    FUNCIONARIO = 'F'
+    ENTRADA = 'E'
+    SAIDA = 'S'
+    
+    def __init__(self, diretorio: str = 'dados_ponto', intervalo_snapshot: int = 10_000, sincronizar: bool = False):
+        self.diretorio = diretorio
+        self.intervalo_snapshot = intervalo_snapshot
+        self.sincronizar = sincronizar
+        os.makedirs(diretorio, exist_ok=True)
+        self._caminho_diario = os.path.join(diretorio, 'diario.jsonl')
+        self._caminho_meta = os.path.join(diretorio, 'snapshot.json')
+        
+        # A numeração continua de onde o snapshot e o diário pararam, mesmo sem restaurar()
+        meta = self._ler_meta()
+        inicio = meta['sequencia'] if meta is not None else 0
+        posteriores = [linha[0] for linha in self._ler_diario() if linha[0] > inicio]
+        self.sequencia = posteriores[-1] if posteriores else inicio
+        self._desde_snapshot = len(posteriores)
+        # Com estado salvo, um snapshot antes de restaurar() gravaria o sistema sem esses dados
+        self._carregado = meta is None and not posteriores
+        self._arquivo = open(self._caminho_diario, 'a', encoding='utf-8')
+    
+    def fechar(self) -> None:
+        """Fecha o arquivo do diário"""
+        self._arquivo.close()
+    
+    def registrar(self, operacao: str, linhas) -> None:
+        """Anexa uma linha por operação aplicada; `linhas` são tuplas com os campos"""
+        registros = []
+        for campos in linhas:
+            self.sequencia += 1
+            registros.append(json.dumps([self.sequencia, operacao, *campos], ensure_ascii=False, separators=(',', ':')))
+        if not registros:
+            return
+        
+        self._arquivo.write('\n'.join(registros) + '\n')
+        self._arquivo.flush()
+        if self.sincronizar:
+            os.fsync(self._arquivo.fileno())
+        self._desde_snapshot += len(registros)
+    
+    def precisa_snapshot(self) -> bool:
+        """Indica se já passou o intervalo configurado desde o último snapshot"""
+        return self._carregado and self._desde_snapshot >= self.intervalo_snapshot
+    
+    def _ler_meta(self) -> dict:
+        if not os.path.exists(self._caminho_meta):
+            return None
+        with open(self._caminho_meta, encoding='utf-8') as arquivo:
+            return json.load(arquivo)
+    
+    def _ler_diario(self) -> list:
+        """Linhas completas do diário decodificadas; corta a última se a gravação foi interrompida"""
+        if not os.path.exists(self._caminho_diario):
+            return []
+        linhas, valido = [], 0
+        with open(self._caminho_diario, 'rb') as arquivo:
+            for linha in arquivo:
+                if not linha.endswith(b'\n'):
+                    break
+                valido += len(linha)
+                linhas.append(json.loads(linha))
+        if valido < os.path.getsize(self._caminho_diario):
+            os.truncate(self._caminho_diario, valido)
+        return linhas
+    
+    def _sincronizar_arquivo(self, caminho: str) -> None:
+        if self.sincronizar:
+            with open(caminho, 'rb+') as arquivo:
+                os.fsync(arquivo.fileno())
+    
+    def _sincronizar_pasta(self) -> None:
+        """Garante as renomeações no disco (só onde dá para abrir a pasta, como no Linux)"""
+        if self.sincronizar and hasattr(os, 'O_DIRECTORY'):
+            descritor = os.open(self.diretorio, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(descritor)
+            finally:
+                os.close(descritor)
+    
+    def gravar_snapshot(self, sistema: 'SistemaPonto') -> None:
+        """Grava o estado atual em Parquet e recomeça o diário; sem operações novas não faz nada"""
+        if not self._carregado:
+            raise RuntimeError("Chame restaurar() antes: o snapshot deixaria de fora o estado já salvo")
+        if self._desde_snapshot == 0 and os.path.exists(self._caminho_meta):
+            return
+        
+        # Grava numa pasta temporária: a pasta para onde o snapshot.json aponta nunca é reescrita
+        pasta = os.path.join(self.diretorio, f'snapshot-{self.sequencia}')
+        temporaria = pasta + '.tmp'
+        shutil.rmtree(temporaria, ignore_errors=True)
+        os.makedirs(temporaria)
+        for nome, tabela in (('funcionarios.parquet', sistema.funcionarios_df),
+                             ('registros.parquet', sistema.registros_ponto_df)):
+            tabela.to_parquet(os.path.join(temporaria, nome), index=False)
+            self._sincronizar_arquivo(os.path.join(temporaria, nome))
+        shutil.rmtree(pasta, ignore_errors=True)  # sobra de uma gravação interrompida
+        os.replace(temporaria, pasta)
+        
+        # O snapshot só passa a valer quando o snapshot.json é trocado de forma atômica
+        temporario = self._caminho_meta + '.tmp'
+        with open(temporario, 'w', encoding='utf-8') as arquivo:
+            json.dump({'sequencia': self.sequencia, 'pasta': os.path.basename(pasta)}, arquivo)
+        self._sincronizar_arquivo(temporario)
+        os.replace(temporario, self._caminho_meta)
+        self._sincronizar_pasta()
+        
+        self._arquivo.close()
+        self._arquivo = open(self._caminho_diario, 'w', encoding='utf-8')
+        self._desde_snapshot = 0
+        for nome in os.listdir(self.diretorio):
+            if nome.startswith('snapshot-') and nome != os.path.basename(pasta):
+                shutil.rmtree(os.path.join(self.diretorio, nome), ignore_errors=True)
+    
+    def restaurar(self, sistema: 'SistemaPonto') -> int:
+        """Carrega o último snapshot e reaplica o final do diário; retorna quantas operações reaplicou"""
+        meta = self._ler_meta()
+        inicio = 0
+        if meta is not None:
+            pasta = os.path.join(self.diretorio, meta['pasta'])
+            sistema.armazenamento.carregar(
+                pd.read_parquet(os.path.join(pasta, 'funcionarios.parquet')),
+                pd.read_parquet(os.path.join(pasta, 'registros.parquet'))
+            )
+            inicio = meta['sequencia']
+        
+        armazenamento = sistema.armazenamento
+        self.sequencia = inicio
+        reaplicadas = 0
+        for sequencia, operacao, *campos in self._ler_diario():
+            if sequencia <= inicio:
+                continue
+            
+            if operacao == self.FUNCIONARIO:
+                armazenamento.inserir_funcionario(*campos)
+            elif operacao == self.ENTRADA:
+                armazenamento.inserir_entrada(campos[0], datetime.fromisoformat(campos[1]))
+            elif operacao == self.SAIDA:
+                armazenamento.fechar_saida(campos[0], datetime.fromisoformat(campos[1]))
+            self.sequencia = sequencia
+            reaplicadas += 1
+        
+        self._desde_snapshot = reaplicadas
+        self._carregado = True
+        sistema.cache.limpar()  # o estado foi escrito direto no armazenamento, sem passar pelas versões
+        return reaplicadas
@@ -13,3 +13,25 @@ class TipoEvento(Enum):
     """Enum para tipos de eventos de ponto"""
     ENTRADA = "ENTRADA"
     SAIDA = "SAIDA"
+
+
+class StatusLote(Enum):
+    """Enum para o resultado de cada linha processada em lote"""
+    OK = "OK"
+    FUNCIONARIO_INEXISTENTE = "FUNCIONARIO_INEXISTENTE"
+    TIPO_INVALIDO = "TIPO_INVALIDO"
+    DATA_INVALIDA = "DATA_INVALIDA"
+    SEM_ENTRADA = "SEM_ENTRADA"
+    TURNO_INVALIDO = "TURNO_INVALIDO"
+    IDADE_INVALIDA = "IDADE_INVALIDA"
+    MATRICULA_DUPLICADA = "MATRICULA_DUPLICADA"
+    MATRICULA_INVALIDA = "MATRICULA_INVALIDA"
+    NOME_INVALIDO = "NOME_INVALIDO"
+
+
+class TipoAnomalia(Enum):
+    """Enum para os problemas encontrados nos registros de ponto"""
+    SEM_SAIDA = "SEM_SAIDA"
+    ENTRADA_DUPLICADA = "ENTRADA_DUPLICADA"
+    SOBREPOSICAO = "SOBREPOSICAO"
+    DURACAO_IMPOSSIVEL = "DURACAO_IMPOSSIVEL"
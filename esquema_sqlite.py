@@ -0,0 +1,86 @@
+import sqlite3
+from datetime import datetime
+from indices import normalizar, tokens_nome, casa_tokens
+
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS funcionarios (
+    matricula TEXT PRIMARY KEY,
+    nome TEXT NOT NULL,
+    idade INTEGER NOT NULL,
+    turno TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS registros (
+    id INTEGER PRIMARY KEY,
+    matricula TEXT NOT NULL REFERENCES funcionarios(matricula),
+    entrada INTEGER NOT NULL,
+    saida INTEGER
+);
+CREATE TABLE IF NOT EXISTS nomes_funcionarios (
+    token TEXT NOT NULL,
+    matricula TEXT NOT NULL REFERENCES funcionarios(matricula),
+    PRIMARY KEY (token, matricula)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_registros_matricula ON registros(matricula, entrada);
+CREATE INDEX IF NOT EXISTS idx_registros_entrada ON registros(entrada);
+CREATE INDEX IF NOT EXISTS idx_registros_abertos ON registros(matricula, entrada) WHERE saida IS NULL;
+"""
+
+# Instantes são gravados como segundos inteiros desde 1970-01-01 (sem fuso, como no resto do sistema)
+_EPOCA = datetime(1970, 1, 1)
+
+# SQL fixo dos caminhos quentes: o sqlite3 mantém cada texto compilado no cache
+# de statements da conexão, então cada execução reaproveita o prepared statement.
+SQL_INSERIR_FUNCIONARIO = "INSERT INTO funcionarios (matricula, nome, idade, turno) VALUES (?, ?, ?, ?)"
+SQL_OBTER_FUNCIONARIO = "SELECT nome, idade, turno FROM funcionarios WHERE matricula = ?"
+SQL_INSERIR_ENTRADA = "INSERT INTO registros (matricula, entrada) VALUES (?, ?)"
+SQL_FECHAR_SAIDA = """
+UPDATE registros SET saida = CASE WHEN ?1 < entrada THEN ?1 + 86400 ELSE ?1 END
+WHERE id = (SELECT id FROM registros
+            WHERE matricula = ?2 AND entrada >= ?3 AND entrada < ?4 AND saida IS NULL
+            ORDER BY id LIMIT 1)
+"""
+SQL_INSERIR_TOKEN = "INSERT OR IGNORE INTO nomes_funcionarios (token, matricula) VALUES (?, ?)"
+SQL_BUSCAR_TOKEN = """
+SELECT t.matricula, f.nome FROM nomes_funcionarios t JOIN funcionarios f USING (matricula)
+WHERE t.token >= ? AND t.token < ? ORDER BY t.token, t.matricula
+"""
+SQL_REGISTROS = "SELECT id, matricula, entrada, saida FROM registros"
+
+
+def conectar(caminho: str) -> sqlite3.Connection:
+    """Abre o banco em modo WAL e cria as tabelas e índices que faltarem
+    
+    A conexão pode ser usada por outras threads; quem compartilha serializa o acesso
+    (o SistemaPonto faz isso com a sua trava de escrita).
+    """
+    conexao = sqlite3.connect(caminho, cached_statements=256, check_same_thread=False)
+    conexao.execute("PRAGMA journal_mode=WAL")
+    conexao.execute("PRAGMA synchronous=NORMAL")
+    conexao.executescript(ESQUEMA)
+    return conexao
+
+
+def segundos(instante: datetime) -> int:
+    return int((instante - _EPOCA).total_seconds())
+
+
+def dia_em_segundos(instante: datetime) -> tuple:
+    """Início e fim (exclusivo) do dia do instante, em segundos"""
+    inicio = segundos(instante) // 86400 * 86400
+    return inicio, inicio + 86400
+
+
+def buscar_nomes(conexao: sqlite3.Connection, prefixo: str, limite: int = 10) -> list:
+    """Matrículas cujo nome casa com o prefixo, pela faixa [termo, termo + U+FFFF) do índice de palavras"""
+    termos = normalizar(prefixo).split()
+    if not termos:
+        return []
+    principal = max(termos, key=len)
+    encontrados = []
+    for matricula, nome in conexao.execute(SQL_BUSCAR_TOKEN, (principal, principal + '\uffff')):
+        if matricula not in encontrados and casa_tokens(termos, tokens_nome(nome)):
+            encontrados.append(matricula)
+            if len(encontrados) == limite:
+                break
+    return encontrados
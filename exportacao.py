@@ -0,0 +1,66 @@
+from datetime import datetime
+import pandas as pd
+from sistema import SistemaPonto
+from armazenamento import depois_da_entrada
+
+COLUNAS_EXPORTACAO = ['id', 'matricula', 'nome', 'turno', 'entrada', 'saida']
+TAMANHO_BLOCO = 50_000
+
+
+def blocos_exportacao(sistema: SistemaPonto, inicio: datetime = None, fim: datetime = None, turnos=None,
+                      tamanho: int = TAMANHO_BLOCO):
+    """Gera blocos de `tamanho` linhas (o último pode ser menor) dos registros com nome e turno do funcionário
+    
+    Filtra pela data da entrada (inicio e fim inclusivos) e, se dado, pelos turnos. Saídas
+    anteriores à entrada (bancos gravados antes do ajuste no armazenamento) saem no dia seguinte.
+    Só um bloco de registros fica em memória por vez, além do cadastro de funcionários.
+    """
+    cadastro = sistema.funcionarios_df.set_index('matricula')[['nome', 'turno']]
+    cadastro['turno'] = cadastro['turno'].astype(object)
+    if turnos is not None:
+        turnos = [turno.lower() for turno in ([turnos] if isinstance(turnos, str) else turnos)]
+        cadastro = cadastro[cadastro['turno'].isin(turnos)]
+    
+    pendentes, acumulados = [], 0
+    for bloco in sistema.armazenamento.iterar_periodo(inicio, fim, tamanho):
+        bloco = bloco.join(cadastro, on='matricula', how='inner')[COLUNAS_EXPORTACAO]
+        bloco['saida'] = depois_da_entrada(bloco['entrada'], bloco['saida'])
+        pendentes.append(bloco)
+        acumulados += len(bloco)
+        while acumulados >= tamanho:
+            juntos = pd.concat(pendentes, ignore_index=True)
+            yield juntos.iloc[:tamanho]
+            pendentes, acumulados = [juntos.iloc[tamanho:]], len(juntos) - tamanho
+    if acumulados:
+        yield pd.concat(pendentes, ignore_index=True)
+
+
+def exportar_csv(sistema: SistemaPonto, caminho: str, inicio: datetime = None, fim: datetime = None,
+                 turnos=None, tamanho: int = TAMANHO_BLOCO) -> int:
+    """Grava os registros filtrados em CSV, bloco a bloco; retorna o número de linhas"""
+    total = 0
+    with open(caminho, 'w', encoding='utf-8', newline='') as arquivo:
+        arquivo.write(','.join(COLUNAS_EXPORTACAO) + '\n')
+        for bloco in blocos_exportacao(sistema, inicio, fim, turnos, tamanho):
+            bloco.to_csv(arquivo, header=False, index=False, date_format='%Y-%m-%d %H:%M:%S')
+            total += len(bloco)
+    print(f"✅ {total} registros exportados para {caminho}")
+    return total
+
+
+def exportar_parquet(sistema: SistemaPonto, caminho: str, inicio: datetime = None, fim: datetime = None,
+                     turnos=None, tamanho: int = TAMANHO_BLOCO) -> int:
+    """Grava os registros filtrados em Parquet, um row group por bloco (requer pyarrow); retorna o número de linhas"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    esquema = pa.schema([('id', pa.int64()), ('matricula', pa.string()), ('nome', pa.string()),
+                         ('turno', pa.string()), ('entrada', pa.timestamp('ns')), ('saida', pa.timestamp('ns'))])
+    total = 0
+    with pq.ParquetWriter(caminho, esquema) as escritor:
+        for bloco in blocos_exportacao(sistema, inicio, fim, turnos, tamanho):
+            escritor.write_table(pa.Table.from_pandas(bloco, schema=esquema, preserve_index=False),
+                                 row_group_size=tamanho)
+            total += len(bloco)
+    print(f"✅ {total} registros exportados para {caminho}")
+    return total
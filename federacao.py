@@ -0,0 +1,212 @@
+import multiprocessing
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from enums import TipoEvento, StatusLote
+from modelos import Funcionario
+from sistema import SistemaPonto, imprimir_relatorio
+from armazenamento import TURNO_DTYPE
+from armazenamento_sqlite import ArmazenamentoSQLite
+
+
+def _resolver(sistema: SistemaPonto, caminho: str):
+    """Método pelo caminho com pontos, ex.: 'armazenamento.estatisticas_funcionarios'"""
+    alvo = sistema
+    for parte in caminho.split('.'):
+        alvo = getattr(alvo, parte)
+    return alvo
+
+
+def sistema_sqlite(caminho: str) -> SistemaPonto:
+    """Fábrica para ShardProcesso: um SistemaPonto sobre o banco SQLite da unidade"""
+    return SistemaPonto(ArmazenamentoSQLite(caminho))
+
+
+class ShardLocal:
+    """Unidade que roda no próprio processo"""
+    
+    def __init__(self, sistema: SistemaPonto):
+        self.sistema = sistema
+    
+    def chamar(self, metodo: str, *args, **kwargs):
+        return _resolver(self.sistema, metodo)(*args, **kwargs)
+    
+    def fechar(self) -> None:
+        pass
+
+
+def _servir_shard(conexao, fabrica, argumentos) -> None:
+    """Laço do processo de uma unidade: recebe (metodo, args, kwargs) e devolve (ok, resultado)"""
+    sistema = fabrica(*argumentos)
+    while (pedido := conexao.recv()) is not None:
+        metodo, args, kwargs = pedido
+        try:
+            conexao.send((True, _resolver(sistema, metodo)(*args, **kwargs)))
+        except Exception as erro:
+            conexao.send((False, erro))
+    if hasattr(sistema.armazenamento, 'fechar'):
+        sistema.armazenamento.fechar()
+    conexao.close()
+
+
+class ShardProcesso:
+    """Unidade em outro processo, criada com `fabrica(*argumentos)` e acessada por um Pipe
+    
+    A fábrica precisa ser uma função de módulo (ex.: `sistema_sqlite`) para funcionar também
+    com o método spawn; os resultados precisam ser serializáveis (geradores não são).
+    """
+    
+    def __init__(self, fabrica, *argumentos):
+        self._conexao, remota = multiprocessing.Pipe()
+        self._processo = multiprocessing.Process(target=_servir_shard, args=(remota, fabrica, argumentos), daemon=True)
+        self._processo.start()
+        remota.close()
+        self._trava = threading.Lock()
+    
+    def chamar(self, metodo: str, *args, **kwargs):
+        with self._trava:
+            self._conexao.send((metodo, args, kwargs))
+            ok, resultado = self._conexao.recv()
+        if not ok:
+            raise resultado
+        return resultado
+    
+    def fechar(self) -> None:
+        with self._trava:
+            self._conexao.send(None)
+        self._processo.join()
+        self._conexao.close()
+
+
+def combinar_estatisticas(parciais) -> dict:
+    """Junta as estatísticas_funcionarios de várias unidades sem precisar das linhas"""
+    parciais = [p for p in parciais if p['total']]
+    total = sum(p['total'] for p in parciais)
+    por_turno = pd.Series(0, index=TURNO_DTYPE.categories, dtype=np.int64)
+    for parcial in parciais:
+        for turno, quantidade in parcial['por_turno'].items():
+            por_turno[turno] += quantidade
+    por_turno = por_turno[por_turno > 0]
+    return {
+        'total': total,
+        'por_turno': por_turno.sort_values(ascending=False, kind='stable').to_dict(),
+        'idade_media': sum(p['idade_media'] * p['total'] for p in parciais) / total if total else None,
+        'idade_min': min((p['idade_min'] for p in parciais), default=None),
+        'idade_max': max((p['idade_max'] for p in parciais), default=None)
+    }
+
+
+class Federacao:
+    """Várias unidades (SistemaPonto locais ou em outros processos) consultadas como uma só
+    
+    Matrícula e batidas vão para a unidade dona da matrícula, achada uma vez e guardada no
+    diretório. Relatórios rodam em paralelo em todas as unidades e só os agregados parciais
+    voltam para ser combinados aqui.
+    """
+    
+    def __init__(self, unidades: dict):
+        self.unidades = dict(unidades)
+        self.diretorio = {}
+        self._trava = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max(len(self.unidades), 1))
+    
+    def fechar(self) -> None:
+        self._executor.shutdown()
+        for unidade in self.unidades.values():
+            unidade.fechar()
+    
+    def _em_todas(self, metodo: str, *args, **kwargs) -> dict:
+        """Chama o método em todas as unidades em paralelo; retorna {nome: resultado}"""
+        futuros = {nome: self._executor.submit(unidade.chamar, metodo, *args, **kwargs)
+                   for nome, unidade in self.unidades.items()}
+        return {nome: futuro.result() for nome, futuro in futuros.items()}
+    
+    def dono(self, matricula: str) -> str:
+        """Nome da unidade onde a matrícula está cadastrada (None se em nenhuma)"""
+        with self._trava:
+            if matricula in self.diretorio:
+                return self.diretorio[matricula]
+        linhas = self._em_todas('armazenamento.obter_funcionario', matricula)
+        dono = next((nome for nome, linha in linhas.items() if linha is not None), None)
+        if dono is not None:
+            with self._trava:
+                self.diretorio[matricula] = dono
+        return dono
+    
+    # ---- FUNCIONÁRIOS ----
+    
+    def cadastrar_funcionario(self, unidade: str, matricula: str, nome: str, idade: int, turno: str) -> bool:
+        """Cadastra na unidade dada, recusando matrículas que já existem em qualquer unidade"""
+        if unidade not in self.unidades:
+            print(f"❌ Unidade {unidade} não existe!")
+            return False
+        if self.dono(matricula) is not None:
+            print(f"❌ Matrícula {matricula} já existe!")
+            return False
+        
+        cadastrado = self.unidades[unidade].chamar('cadastrar_funcionario', matricula, nome, idade, turno)
+        if cadastrado:
+            with self._trava:
+                self.diretorio[matricula] = unidade
+        return cadastrado
+    
+    def get_funcionario(self, matricula: str) -> Funcionario:
+        dono = self.dono(matricula)
+        if dono is None:
+            return None
+        return Funcionario(matricula, *self.unidades[dono].chamar('armazenamento.obter_funcionario', matricula))
+    
+    # ---- REGISTRO DE PONTO ----
+    
+    def registrar_evento(self, matricula: str, tipo: TipoEvento, data: str = None, hora: str = None) -> bool:
+        dono = self.dono(matricula)
+        if dono is None:
+            print(f"❌ Funcionário não existe!")
+            return False
+        return self.unidades[dono].chamar('registrar_evento', matricula, tipo, data, hora)
+    
+    def registrar_eventos_em_lote(self, eventos) -> np.ndarray:
+        """Divide o lote entre as unidades donas, grava em paralelo e devolve o status na ordem original"""
+        colunas = ['matricula', 'tipo', 'data', 'hora']
+        if isinstance(eventos, pd.DataFrame):
+            lote = eventos[colunas].reset_index(drop=True)
+        else:
+            lote = pd.DataFrame(list(eventos), columns=colunas)
+        
+        donos = pd.Series({m: self.dono(m) for m in lote['matricula'].unique()})
+        por_linha = lote['matricula'].map(donos)
+        status = np.full(len(lote), StatusLote.FUNCIONARIO_INEXISTENTE.value, dtype=object)
+        futuros = {nome: self._executor.submit(self.unidades[nome].chamar, 'registrar_eventos_em_lote', parte)
+                   for nome, parte in lote.groupby(por_linha, sort=False)}
+        for nome, futuro in futuros.items():
+            status[np.flatnonzero((por_linha == nome).to_numpy())] = futuro.result()
+        return status
+    
+    def consultar_eventos(self, matricula: str, inicio: datetime = None, fim: datetime = None) -> pd.DataFrame:
+        dono = self.dono(matricula)
+        if dono is None:
+            return pd.DataFrame(columns=['matricula', 'nome', 'data', 'entrada', 'saida'])
+        return self.unidades[dono].chamar('consultar_eventos', matricula, inicio, fim)
+    
+    # ---- RELATÓRIOS ----
+    
+    def estatisticas_funcionarios(self) -> dict:
+        return combinar_estatisticas(self._em_todas('armazenamento.estatisticas_funcionarios').values())
+    
+    def contar_registros(self) -> int:
+        return sum(self._em_todas('armazenamento.contar_registros').values())
+    
+    def horas_trabalhadas_periodo(self, inicio: datetime = None, fim: datetime = None) -> pd.DataFrame:
+        """Horas por funcionário de todas as unidades (cada unidade já manda o resumo por funcionário)"""
+        partes = self._em_todas('horas_trabalhadas_periodo', inicio, fim)
+        return pd.concat([parte.assign(unidade=nome) for nome, parte in partes.items()], ignore_index=True)
+    
+    def gerar_relatorio_completo(self) -> None:
+        """Relatório da empresa inteira, com uma linha de totais por unidade"""
+        estatisticas = self._em_todas('armazenamento.estatisticas_funcionarios')
+        registros = self._em_todas('armazenamento.contar_registros')
+        imprimir_relatorio(combinar_estatisticas(estatisticas.values()), sum(registros.values()))
+        for nome in self.unidades:
+            print(f"   🏭 {nome}: {estatisticas[nome]['total']} funcionários, {registros[nome]} registros")
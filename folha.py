@@ -0,0 +1,112 @@
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import shared_memory
+import numpy as np
+import pandas as pd
+from enums import Turno
+from calculos import no_periodo
+
+
+JORNADA_DIARIA = 8.0
+
+_NS_DIA = 86_400 * 10**9
+_NS_HORA = 3_600 * 10**9
+_NAT = np.iinfo(np.int64).min
+
+# Linhas do bloco compartilhado (uma coluna por registro de ponto)
+_CODIGO, _ENTRADA, _SAIDA, _NOTURNO = range(4)
+
+
+def _folha_colunas(colunas: np.ndarray) -> tuple:
+    """Horas, dias trabalhados (úteis) e horas extras por código de matrícula
+    
+    `colunas` é um array int64 (4, n) com código, entrada, saída (ns) e flag de noturno.
+    A soma por dia segue a ordem das linhas, então o resultado de um código não depende
+    de como os demais foram particionados.
+    """
+    codigo, entrada, saida, noturno = colunas
+    duracao = np.where(saida == _NAT, -1, saida - entrada)
+    duracao = np.where((noturno == 1) & (saida != _NAT) & (duracao < 0), duracao + _NS_DIA, duracao)
+    horas = np.where(duracao >= 0, duracao / _NS_HORA, 0.0)
+    dia = entrada // _NS_DIA
+    
+    por_dia = pd.DataFrame({'codigo': codigo, 'dia': dia, 'horas': horas}).groupby(['codigo', 'dia'])['horas'].sum()
+    dias = por_dia.index.get_level_values('dia').to_numpy()
+    util = np.is_busday(dias.astype('datetime64[D]'))
+    extras = np.clip(por_dia.to_numpy() - JORNADA_DIARIA, 0, None)
+    
+    resumo = pd.DataFrame({'horas': por_dia.to_numpy(), 'dias_trabalhados': util.astype(np.int64),
+                           'horas_extras': extras},
+                          index=por_dia.index.get_level_values('codigo')).groupby(level=0).sum()
+    return (resumo.index.to_numpy(), resumo['horas'].to_numpy(), resumo['dias_trabalhados'].to_numpy(),
+            resumo['horas_extras'].to_numpy())
+
+
+def _folha_fatia(nome_memoria: str, total: int, inicio: int, fim: int) -> tuple:
+    """Processa as colunas [inicio, fim) do bloco compartilhado (executa no processo filho)"""
+    memoria = shared_memory.SharedMemory(name=nome_memoria)
+    try:
+        colunas = np.ndarray((4, total), dtype=np.int64, buffer=memoria.buf)
+        resultado = _folha_colunas(colunas[:, inicio:fim])
+        del colunas
+        return resultado
+    finally:
+        memoria.close()
+
+
+def gerar_folha(registros: pd.DataFrame, funcionarios: pd.DataFrame, inicio: datetime, fim: datetime,
+                trabalhadores: int = 1) -> pd.DataFrame:
+    """Folha do período: horas, dias trabalhados, faltas e horas extras por funcionário
+    
+    Com mais de um trabalhador, os registros são particionados pelo hash da matrícula e
+    cada partição é lida por um processo direto de um bloco de memória compartilhada; os
+    resumos parciais são juntados no fim. Todas as linhas de uma matrícula caem na mesma
+    partição e mantêm a ordem original, então o resultado é idêntico ao da execução serial.
+    """
+    registros = registros[no_periodo(registros['entrada'], inicio, fim)]
+    matriculas = pd.Index(funcionarios['matricula'])
+    noturnos = np.asarray(funcionarios['turno'], dtype=object) == Turno.NOTURNO.value
+    
+    codigo = matriculas.get_indexer(registros['matricula'])
+    colunas = np.empty((4, len(registros)), dtype=np.int64)
+    colunas[_CODIGO] = codigo
+    colunas[_ENTRADA] = registros['entrada'].to_numpy(dtype='datetime64[ns]').view(np.int64)
+    colunas[_SAIDA] = registros['saida'].to_numpy(dtype='datetime64[ns]').view(np.int64)
+    colunas[_NOTURNO] = noturnos[codigo]
+    
+    if trabalhadores <= 1 or len(registros) == 0:
+        partes = [_folha_colunas(colunas)]
+    else:
+        particao = (pd.util.hash_array(matriculas.to_numpy(dtype=object)) % trabalhadores)[codigo]
+        ordem = np.argsort(particao, kind='stable')
+        limites = np.searchsorted(particao[ordem], np.arange(trabalhadores + 1))
+        
+        memoria = shared_memory.SharedMemory(create=True, size=colunas.nbytes)
+        try:
+            compartilhadas = np.ndarray(colunas.shape, dtype=np.int64, buffer=memoria.buf)
+            compartilhadas[:] = colunas[:, ordem]
+            del compartilhadas
+            with ProcessPoolExecutor(max_workers=trabalhadores) as executor:
+                futuros = [executor.submit(_folha_fatia, memoria.name, colunas.shape[1], limites[i], limites[i + 1])
+                           for i in range(trabalhadores) if limites[i] < limites[i + 1]]
+                partes = [futuro.result() for futuro in futuros]
+        finally:
+            memoria.close()
+            memoria.unlink()
+    
+    resumo = pd.DataFrame({
+        'horas': np.concatenate([p[1] for p in partes]),
+        'dias_trabalhados': np.concatenate([p[2] for p in partes]),
+        'horas_extras': np.concatenate([p[3] for p in partes])
+    }, index=np.concatenate([p[0] for p in partes])).reindex(np.arange(len(matriculas)), fill_value=0)
+    
+    dias_uteis = int(np.busday_count(np.datetime64(pd.Timestamp(inicio).date()),
+                                     np.datetime64(pd.Timestamp(fim).date()) + 1))
+    return pd.DataFrame({
+        'matricula': matriculas.to_numpy(),
+        'nome': np.asarray(funcionarios['nome'], dtype=object),
+        'horas': resumo['horas'].to_numpy(dtype=float),
+        'dias_trabalhados': resumo['dias_trabalhados'].to_numpy(dtype=np.int64),
+        'faltas': np.clip(dias_uteis - resumo['dias_trabalhados'].to_numpy(dtype=np.int64), 0, None),
+        'horas_extras': resumo['horas_extras'].to_numpy(dtype=float)
+    })
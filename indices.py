@@ -0,0 +1,71 @@
+import unicodedata
+from bisect import bisect_left, insort
+
+# Acima disso um lote de nomes novos é ordenado junto com o índice em vez de inserido um a um
+_LIMITE_INSERCAO = 64
+
+
+def normalizar(texto: str) -> str:
+    """Minúsculas e sem acentos, para comparar nomes ("João" == "joao")"""
+    decomposto = unicodedata.normalize('NFKD', texto)
+    return ''.join(c for c in decomposto if not unicodedata.combining(c)).casefold()
+
+
+def tokens_nome(nome: str) -> tuple:
+    return tuple(normalizar(nome).split())
+
+
+def casa_tokens(tokens_busca, tokens: tuple) -> bool:
+    """Cada termo da busca é prefixo de alguma palavra do nome"""
+    return all(any(t.startswith(termo) for t in tokens) for termo in tokens_busca)
+
+
+class IndicePrefixo:
+    """Índice de nomes por prefixo de qualquer palavra, sem diferenciar acentos e maiúsculas
+    
+    Guarda uma lista ordenada de (palavra, ordem) e acha o começo da faixa com bisect;
+    a busca percorre só as palavras com o prefixo pedido.
+    """
+    
+    def __init__(self):
+        self._entradas = []
+        self._matriculas = []
+        self._tokens = []
+    
+    def __len__(self) -> int:
+        return len(self._matriculas)
+    
+    def adicionar(self, matriculas, nomes) -> None:
+        # Tokeniza tudo antes de mexer no índice: um nome inválido não deixa o lote pela metade
+        tokens_lote = [tokens_nome(nome) for nome in nomes]
+        novas = []
+        for matricula, tokens in zip(matriculas, tokens_lote):
+            ordem = len(self._matriculas)
+            self._matriculas.append(matricula)
+            self._tokens.append(tokens)
+            novas.extend((token, ordem) for token in set(tokens))
+        if len(novas) <= _LIMITE_INSERCAO:
+            for entrada in novas:
+                insort(self._entradas, entrada)
+        else:
+            self._entradas.extend(novas)
+            self._entradas.sort()
+    
+    def buscar(self, prefixo: str, limite: int = 10) -> list:
+        """Matrículas cujo nome casa com o prefixo (todas as palavras dele), em ordem alfabética da palavra"""
+        termos = normalizar(prefixo).split()
+        if not termos:
+            return []
+        principal = max(termos, key=len)
+        encontrados, vistos = [], set()
+        for posicao in range(bisect_left(self._entradas, (principal,)), len(self._entradas)):
+            token, ordem = self._entradas[posicao]
+            if not token.startswith(principal):
+                break
+            if ordem in vistos or not casa_tokens(termos, self._tokens[ordem]):
+                continue
+            vistos.add(ordem)
+            encontrados.append(self._matriculas[ordem])
+            if len(encontrados) == limite:
+                break
+        return encontrados
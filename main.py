@@ -1,12 +1,35 @@
+import os
 from sistema import SistemaPonto
+from armazenamento_sqlite import ArmazenamentoSQLite
+from diario import DiarioPonto
 from menus import menu_principal
 from dados import dados_exemplo
+from metricas import instrumentar
 
 
 if __name__ == "__main__":
-    sistema = SistemaPonto()
+    # Estado salvo em dados_ponto/: último snapshot + operações registradas depois dele
+    diario = DiarioPonto('dados_ponto')
+    sistema = SistemaPonto(diario=diario)
+    diario.restaurar(sistema)
+    
+    # Descomente para persistir os dados em SQLite (ponto.db)
+    # sistema = SistemaPonto(ArmazenamentoSQLite('ponto.db'))
     
     # Descomente para carregar dados de exemplo
     # dados_exemplo(sistema)
     
+    # PONTO_METRICAS=1 liga a instrumentação; PONTO_METRICAS_ARQUIVO grava para o node exporter
+    if os.environ.get('PONTO_METRICAS') == '1':
+        metricas = instrumentar(sistema)
+        if os.environ.get('PONTO_METRICAS_ARQUIVO'):
+            metricas.exportar_periodicamente(os.environ['PONTO_METRICAS_ARQUIVO'])
+    
     menu_principal(sistema)
+    
+    if sistema.metricas is not None and os.environ.get('PONTO_METRICAS_ARQUIVO'):
+        sistema.metricas.exportar_prometheus(os.environ['PONTO_METRICAS_ARQUIVO'])
+    
+    if sistema.diario is not None:
+        sistema.diario.gravar_snapshot(sistema)
+        sistema.diario.fechar()
@@ -1,6 +1,21 @@
 from modelos import Funcionario, Administrador
 from sistema import SistemaPonto
 from enums import TipoEvento
+from datetime import datetime
+from exportacao import exportar_csv, exportar_parquet
+
+
+def paginar(paginas, vazio: str) -> None:
+    """Mostra as páginas uma a uma, esperando o usuário entre elas"""
+    pagina = next(paginas, None)
+    if pagina is None:
+        print(f"\n{vazio}")
+        return
+    while pagina is not None:
+        print("\n" + pagina.to_string(index=False))
+        pagina = next(paginas, None)
+        if pagina is not None and input("\nEnter para próxima página, 0 para parar: ").strip() == '0':
+            break
 
 
 def menu_funcionario(funcionario: Funcionario, sistema: SistemaPonto) -> None:
@@ -28,11 +43,7 @@ def menu_funcionario(funcionario: Funcionario, sistema: SistemaPonto) -> None:
             funcionario.registrar_saida(sistema, data, hora)
         
         elif opcao == '3':
-            registros = funcionario.consultar_horarios(sistema)
-            if registros.empty:
-                print("\n📋 Nenhum horário registrado.")
-            else:
-                print("\n" + registros.to_string(index=False))
+            paginar(sistema.iterar_eventos(funcionario.matricula), "📋 Nenhum horário registrado.")
         
         elif opcao == '0':
             print("\n👋 Até logo!")
@@ -53,6 +64,9 @@ def menu_administrador(admin: Administrador, sistema: SistemaPonto) -> None:
         print("4 - Gerar Relatório")
         print("5 - Gráfico: Idade")
         print("6 - Gráfico: Turno")
+        print("7 - Métricas de Desempenho")
+        print("8 - Verificar Anomalias")
+        print("9 - Exportar Registros (CSV/Parquet)")
         print("0 - Sair")
         print("="*50)
         
@@ -69,7 +83,7 @@ def menu_administrador(admin: Administrador, sistema: SistemaPonto) -> None:
             sistema.listar_funcionarios()
         
         elif opcao == '3':
-            sistema.listar_registros_ponto()
+            paginar(sistema.iterar_registros_ponto(), "📋 Nenhum registro de ponto.")
         
         elif opcao == '4':
             admin.gerar_relatorio(sistema)
@@ -80,6 +94,34 @@ def menu_administrador(admin: Administrador, sistema: SistemaPonto) -> None:
         elif opcao == '6':
             admin.gerar_grafico_turno(sistema)
         
+        elif opcao == '7':
+            if sistema.metricas is None:
+                print("❌ Instrumentação desligada (defina PONTO_METRICAS=1 antes de iniciar)")
+            else:
+                print("\n" + sistema.metricas.resumo().round(3).to_string(index=False))
+            cache = sistema.cache.estatisticas()
+            print(f"\n🗃️  Cache de consultas: {cache['acertos']} acertos, {cache['faltas']} faltas "
+                  f"({cache['taxa_acerto']:.0%}), {cache['itens']}/{cache['capacidade']} itens")
+        
+        elif opcao == '8':
+            anomalias = sistema.verificar_anomalias()
+            if anomalias.empty:
+                print("\n✅ Nenhuma anomalia encontrada.")
+            else:
+                print("\n" + anomalias.to_string(index=False))
+        
+        elif opcao == '9':
+            caminho = input("Arquivo (.csv ou .parquet): ").strip()
+            try:
+                inicio, fim = (datetime.strptime(texto, "%d/%m/%Y") if texto else None for texto in
+                               (input(f"Data {lado} (DD/MM/YYYY) ou Enter: ").strip() for lado in ('inicial', 'final')))
+            except ValueError:
+                print("❌ Data inválida!")
+                continue
+            turno = input("Turno ou Enter para todos: ").strip() or None
+            exportar = exportar_parquet if caminho.lower().endswith('.parquet') else exportar_csv
+            exportar(sistema, caminho, inicio, fim, turno)
+        
         elif opcao == '0':
             print("\n👋 Até logo!")
             break
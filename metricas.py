@@ -0,0 +1,179 @@
+import inspect
+import os
+import threading
+import time
+from functools import wraps
+import numpy as np
+import pandas as pd
+
+# Limites (em segundos) das faixas do histograma de latência, como os padrões do Prometheus
+LIMITES_LATENCIA = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+_FIM = object()
+
+
+class _Operacao:
+    __slots__ = ('chamadas', 'erros', 'soma', 'maximo', 'linhas', 'varridas', 'faixas')
+    
+    def __init__(self):
+        self.chamadas = 0
+        self.erros = 0
+        self.soma = 0.0
+        self.maximo = 0.0
+        self.linhas = 0
+        self.varridas = 0
+        self.faixas = [0] * (len(LIMITES_LATENCIA) + 1)
+
+
+def _linhas(operacao: str, resultado, args) -> int:
+    """Linhas retornadas ou gravadas por uma chamada: o tamanho do retorno ou, nas inserções, do que foi recebido
+    
+    As linhas examinadas para chegar ao resultado vêm à parte, de `linhas_varridas` do armazenamento.
+    """
+    if isinstance(resultado, (pd.DataFrame, pd.Series, np.ndarray)):
+        return len(resultado)
+    if isinstance(resultado, bool):
+        return int(resultado)
+    if resultado is None and operacao.rpartition('.')[2].startswith('inserir_') and args:
+        return len(args[0]) if isinstance(args[0], (list, np.ndarray, pd.Series)) else 1
+    return 0
+
+
+class Metricas:
+    """Chamadas, latências e linhas retornadas/gravadas e varridas por operação (seguro entre threads)"""
+    
+    def __init__(self, prefixo: str = 'ponto'):
+        self.prefixo = prefixo
+        self._operacoes = {}
+        self._trava = threading.Lock()
+    
+    def registrar(self, operacao: str, segundos: float, linhas: int = 0, erro: bool = False,
+                  varridas: int = 0) -> None:
+        with self._trava:
+            dados = self._operacoes.get(operacao)
+            if dados is None:
+                dados = self._operacoes[operacao] = _Operacao()
+            dados.chamadas += 1
+            dados.erros += erro
+            dados.soma += segundos
+            dados.maximo = max(dados.maximo, segundos)
+            dados.linhas += linhas
+            dados.varridas += varridas
+            dados.faixas[np.searchsorted(LIMITES_LATENCIA, segundos)] += 1
+    
+    def _percentil(self, dados: _Operacao, fracao: float) -> float:
+        """Limite superior da faixa onde cai o percentil (nunca acima do máximo observado)"""
+        acumulado = np.cumsum(dados.faixas)
+        faixa = int(np.searchsorted(acumulado, fracao * dados.chamadas))
+        return min(LIMITES_LATENCIA[faixa], dados.maximo) if faixa < len(LIMITES_LATENCIA) else dados.maximo
+    
+    def resumo(self) -> pd.DataFrame:
+        """Uma linha por operação: chamadas, erros, latências em ms, linhas retornadas/gravadas e varridas"""
+        with self._trava:
+            linhas = [{
+                'operacao': nome,
+                'chamadas': dados.chamadas,
+                'erros': dados.erros,
+                'media_ms': dados.soma / dados.chamadas * 1000,
+                'p50_ms': self._percentil(dados, 0.5) * 1000,
+                'p99_ms': self._percentil(dados, 0.99) * 1000,
+                'max_ms': dados.maximo * 1000,
+                'linhas': dados.linhas,
+                'linhas_varridas': dados.varridas
+            } for nome, dados in sorted(self._operacoes.items())]
+        return pd.DataFrame(linhas, columns=['operacao', 'chamadas', 'erros', 'media_ms', 'p50_ms',
+                                             'p99_ms', 'max_ms', 'linhas', 'linhas_varridas'])
+    
+    def texto_prometheus(self) -> str:
+        """Métricas no formato de texto do Prometheus"""
+        p = self.prefixo
+        saida = [
+            f"# HELP {p}_operacao_duracao_segundos Latência das operações do sistema de ponto",
+            f"# TYPE {p}_operacao_duracao_segundos histogram"
+        ]
+        with self._trava:
+            operacoes = sorted(self._operacoes.items())
+            for nome, dados in operacoes:
+                acumulado = 0
+                for limite, quantidade in zip(LIMITES_LATENCIA + ('+Inf',), dados.faixas):
+                    acumulado += quantidade
+                    saida.append(f'{p}_operacao_duracao_segundos_bucket{{operacao="{nome}",le="{limite}"}} {acumulado}')
+                saida.append(f'{p}_operacao_duracao_segundos_sum{{operacao="{nome}"}} {dados.soma}')
+                saida.append(f'{p}_operacao_duracao_segundos_count{{operacao="{nome}"}} {dados.chamadas}')
+            for metrica, ajuda, campo in ((f"{p}_operacao_erros_total", "Chamadas que terminaram em exceção", 'erros'),
+                                          (f"{p}_operacao_linhas_total", "Linhas retornadas ou gravadas", 'linhas'),
+                                          (f"{p}_operacao_linhas_varridas_total", "Linhas examinadas no armazenamento",
+                                           'varridas')):
+                saida += [f"# HELP {metrica} {ajuda}", f"# TYPE {metrica} counter"]
+                saida += [f'{metrica}{{operacao="{nome}"}} {getattr(dados, campo)}' for nome, dados in operacoes]
+        return "\n".join(saida) + "\n"
+    
+    def exportar_prometheus(self, caminho: str) -> None:
+        """Grava o arquivo para o textfile collector do node exporter (troca atômica)"""
+        temporario = f"{caminho}.{os.getpid()}.tmp"
+        with open(temporario, 'w', encoding='utf-8') as arquivo:
+            arquivo.write(self.texto_prometheus())
+        os.replace(temporario, caminho)
+    
+    def exportar_periodicamente(self, caminho: str, intervalo: float = 15.0) -> threading.Thread:
+        """Regrava o arquivo a cada `intervalo` segundos numa thread daemon"""
+        def exportar():
+            while True:
+                time.sleep(intervalo)
+                self.exportar_prometheus(caminho)
+        
+        thread = threading.Thread(target=exportar, name='exportar-metricas', daemon=True)
+        thread.start()
+        return thread
+
+
+def _medir(metricas: Metricas, operacao: str, metodo, armazenamento):
+    if inspect.isgeneratorfunction(metodo):
+        @wraps(metodo)
+        def gerador(*args, **kwargs):
+            inicio, linhas, varridas, erro = time.perf_counter(), 0, 0, False
+            iterador = metodo(*args, **kwargs)
+            try:
+                while True:
+                    # Só o trabalho do próximo bloco; o que o chamador faz entre blocos fica de fora
+                    antes = armazenamento.linhas_varridas
+                    item = next(iterador, _FIM)
+                    varridas += armazenamento.linhas_varridas - antes
+                    if item is _FIM:
+                        break
+                    linhas += _linhas(operacao, item, ())
+                    yield item
+            except Exception:
+                erro = True
+                raise
+            finally:
+                metricas.registrar(operacao, time.perf_counter() - inicio, linhas, erro, varridas)
+        return gerador
+    
+    @wraps(metodo)
+    def medido(*args, **kwargs):
+        inicio, antes = time.perf_counter(), armazenamento.linhas_varridas
+        try:
+            resultado = metodo(*args, **kwargs)
+        except Exception:
+            metricas.registrar(operacao, time.perf_counter() - inicio, 0, True,
+                               armazenamento.linhas_varridas - antes)
+            raise
+        metricas.registrar(operacao, time.perf_counter() - inicio, _linhas(operacao, resultado, args), False,
+                           armazenamento.linhas_varridas - antes)
+        return resultado
+    return medido
+
+
+def instrumentar(sistema, metricas: Metricas = None) -> Metricas:
+    """Liga a instrumentação: mede os métodos públicos do sistema e do seu armazenamento
+    
+    Os métodos medidos são colocados na própria instância, então sem chamar esta
+    função nada muda no caminho das operações.
+    """
+    metricas = metricas or Metricas()
+    for objeto, prefixo in ((sistema, ''), (sistema.armazenamento, 'armazenamento.')):
+        for nome, metodo in inspect.getmembers(type(objeto), inspect.isfunction):
+            if not nome.startswith('_'):
+                setattr(objeto, nome, _medir(metricas, prefixo + nome, metodo.__get__(objeto), sistema.armazenamento))
+    sistema.metricas = metricas
+    return metricas
@@ -1,16 +1,53 @@
+import threading
 import pandas as pd
 from datetime import datetime
 from enums import Turno, TipoEvento
+from calculos import horas_por_matricula
+
+
+TURNOS = {t.value: t for t in Turno}
+IDADE_MINIMA, IDADE_MAXIMA = 14, 100
 
 
 class Funcionario:
-    """Representa um funcionário do sistema"""
+    """Representa um funcionário do sistema
+    
+    Pode ser criado com os dados em mãos ou como visão de uma linha do armazenamento
+    (`Funcionario.visao`), que só lê nome, idade e turno quando algum deles é acessado.
+    """
+    
+    __slots__ = ('matricula', '_armazenamento', '_linha')
     
     def __init__(self, matricula: str, nome: str, idade: int, turno: Turno):
         self.matricula = matricula
-        self.nome = nome
-        self.idade = idade
-        self.turno = turno
+        self._armazenamento = None
+        self._linha = (nome, idade, turno.value if isinstance(turno, Turno) else turno)
+    
+    @classmethod
+    def visao(cls, armazenamento: 'Armazenamento', matricula: str, linha: tuple = None) -> 'Funcionario':
+        """Funcionário apoiado no armazenamento; `linha` (nome, idade, turno) evita a leitura se já foi feita"""
+        funcionario = cls.__new__(cls)
+        funcionario.matricula = matricula
+        funcionario._armazenamento = armazenamento
+        funcionario._linha = linha
+        return funcionario
+    
+    def _campos(self) -> tuple:
+        if self._linha is None:
+            self._linha = self._armazenamento.obter_funcionario(self.matricula)
+        return self._linha
+    
+    @property
+    def nome(self) -> str:
+        return self._campos()[0]
+    
+    @property
+    def idade(self) -> int:
+        return self._campos()[1]
+    
+    @property
+    def turno(self) -> Turno:
+        return TURNOS.get(self._campos()[2])
     
     def registrar_entrada(self, sistema: 'SistemaPonto', data: str = None, hora: str = None) -> bool:
         """Registra entrada do funcionário"""
@@ -25,15 +62,39 @@ class Funcionario:
         return sistema.consultar_eventos(self.matricula)
 
 
+class AlocadorIds:
+    """Entrega ids únicos entre threads sem disputar trava a cada id
+    
+    Cada thread reserva um bloco de `tamanho_bloco` ids de uma vez (a única parte
+    sob trava) e vai consumindo dele; ids de threads diferentes podem se intercalar.
+    """
+    
+    def __init__(self, inicio: int = 1, tamanho_bloco: int = 1024):
+        self.tamanho_bloco = tamanho_bloco
+        self._proximo_bloco = inicio
+        self._trava = threading.Lock()
+        self._local = threading.local()
+    
+    def proximo(self) -> int:
+        bloco = getattr(self._local, 'bloco', None)
+        valor = next(bloco, None) if bloco is not None else None
+        if valor is None:
+            with self._trava:
+                inicio = self._proximo_bloco
+                self._proximo_bloco += self.tamanho_bloco
+            self._local.bloco = bloco = iter(range(inicio, inicio + self.tamanho_bloco))
+            valor = next(bloco)
+        return valor
+
+
 class EventoPonto:
     """Representa um evento de ponto (entrada/saída)"""
     
-    id_counter = 1
+    __slots__ = ('id', 'data_hora', 'tipo')
+    ids = AlocadorIds()
     
     def __init__(self, id: int, data_hora: datetime, tipo: TipoEvento):
-        self.id = id if id else EventoPonto.id_counter
-        if id is None:
-            EventoPonto.id_counter += 1
+        self.id = EventoPonto.ids.proximo() if id is None else id
         self.data_hora = data_hora
         self.tipo = tipo
 
@@ -46,9 +107,14 @@ class RelatorioPonto:
         self.periodo_final = periodo_final
         self.funcionario = funcionario
     
-    def calcular_horas_trabalhadas(self) -> float:
-        """Calcula total de horas trabalhadas"""
-        pass
+    def calcular_horas_trabalhadas(self, sistema: 'SistemaPonto') -> float:
+        """Calcula total de horas trabalhadas no período (turnos fechados)"""
+        funcionario = pd.DataFrame({'matricula': [self.funcionario.matricula],
+                                    'turno': [self.funcionario.turno.value if self.funcionario.turno else None]})
+        registros = sistema.armazenamento.eventos_funcionario(self.funcionario.matricula,
+                                                              self.periodo_inicial, self.periodo_final)
+        resumo = horas_por_matricula(registros, funcionario, self.periodo_inicial, self.periodo_final)
+        return float(resumo['horas'].iloc[0])
 
 
 class Administrador:
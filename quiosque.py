@@ -0,0 +1,94 @@
+from datetime import datetime
+from esquema_sqlite import (SQL_OBTER_FUNCIONARIO, SQL_INSERIR_ENTRADA, SQL_FECHAR_SAIDA,
+                            conectar, segundos, dia_em_segundos, buscar_nomes)
+
+
+class Quiosque:
+    """Terminal de ponto: só registra entrada e saída direto no banco SQLite
+    
+    Não importa pandas, numpy nem matplotlib, para abrir rápido; o mesmo banco
+    pode ser lido depois pelo SistemaPonto com ArmazenamentoSQLite.
+    """
+    
+    def __init__(self, caminho: str = 'ponto.db'):
+        self._conexao = conectar(caminho)
+    
+    def fechar(self) -> None:
+        """Fecha a conexão com o banco"""
+        self._conexao.close()
+    
+    def _nome(self, matricula: str) -> str:
+        funcionario = self._conexao.execute(SQL_OBTER_FUNCIONARIO, (matricula,)).fetchone()
+        return funcionario[0] if funcionario else None
+    
+    def buscar(self, prefixo: str, limite: int = 10) -> list:
+        """(matricula, nome) dos funcionários cujo nome começa pelo prefixo em qualquer palavra"""
+        return [(matricula, self._nome(matricula)) for matricula in buscar_nomes(self._conexao, prefixo, limite)]
+    
+    def registrar_entrada(self, matricula: str, agora: datetime = None) -> bool:
+        """Registra entrada no instante atual (ou em `agora`)"""
+        nome = self._nome(matricula)
+        if nome is None:
+            print(f"❌ Funcionário não existe!")
+            return False
+        
+        agora = (agora or datetime.now()).replace(second=0, microsecond=0)
+        with self._conexao:
+            self._conexao.execute(SQL_INSERIR_ENTRADA, (matricula, segundos(agora)))
+        print(f"✅ Entrada registrada para {nome}")
+        return True
+    
+    def registrar_saida(self, matricula: str, agora: datetime = None) -> bool:
+        """Fecha a entrada aberta de hoje no instante atual (ou em `agora`)"""
+        agora = (agora or datetime.now()).replace(second=0, microsecond=0)
+        with self._conexao:
+            fechada = self._conexao.execute(
+                SQL_FECHAR_SAIDA, (segundos(agora), matricula, *dia_em_segundos(agora))).rowcount == 1
+        if not fechada:
+            print(f"❌ Nenhuma entrada registrada hoje!")
+            return False
+        
+        print(f"✅ Saída registrada para {self._nome(matricula)}")
+        return True
+
+
+def menu_quiosque(quiosque: Quiosque) -> None:
+    """Menu do terminal de ponto"""
+    while True:
+        print(f"\n{'='*50}")
+        print("QUIOSQUE DE PONTO".center(50))
+        print("="*50)
+        print("1 - Registrar Entrada")
+        print("2 - Registrar Saída")
+        print("3 - Buscar por Nome")
+        print("0 - Sair")
+        print("="*50)
+        
+        opcao = input("\nOpção: ").strip()
+        
+        if opcao in ('1', '2'):
+            matricula = input("Matrícula: ").strip()
+            if opcao == '1':
+                quiosque.registrar_entrada(matricula)
+            else:
+                quiosque.registrar_saida(matricula)
+        
+        elif opcao == '3':
+            encontrados = quiosque.buscar(input("Nome: ").strip())
+            if not encontrados:
+                print("📋 Nenhum funcionário encontrado.")
+            for matricula, nome in encontrados:
+                print(f"{matricula} - {nome}")
+        
+        elif opcao == '0':
+            print("\n👋 Até logo!")
+            break
+        
+        else:
+            print("❌ Opção inválida!")
+
+
+if __name__ == "__main__":
+    quiosque = Quiosque('ponto.db')
+    menu_quiosque(quiosque)
+    quiosque.fechar()
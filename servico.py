@@ -0,0 +1,101 @@
+import asyncio
+from sistema import SistemaPonto
+from diario import DiarioPonto
+
+TAMANHO_LOTE = 512
+TAMANHO_FILA = 10_000
+
+
+class ServicoPonto:
+    """Serviço TCP de ponto para vários terminais ao mesmo tempo
+    
+    Cada linha recebida é um pedido "TIPO MATRICULA [DD/MM/YYYY HH:MM]" e recebe uma
+    linha de resposta com o StatusLote. Os pedidos entram numa fila esvaziada por um
+    único escritor, que aplica no SistemaPonto em lotes tudo o que chegou enquanto o
+    lote anterior era gravado; só ele toca no sistema, então não há corrida nos dados.
+    """
+    
+    def __init__(self, sistema: SistemaPonto, tamanho_lote: int = TAMANHO_LOTE):
+        self.sistema = sistema
+        self.tamanho_lote = tamanho_lote
+        self._fila = None
+    
+    def _montar_lote(self, primeiro: tuple) -> tuple:
+        """Junta pedidos já enfileirados, no máximo um por matrícula (a ordem de cada terminal é mantida)
+        
+        Retorna o lote e o pedido que ficou para o próximo lote (ou None).
+        """
+        lote = [primeiro]
+        matriculas = {primeiro[0][0]}
+        while len(lote) < self.tamanho_lote and not self._fila.empty():
+            pedido = self._fila.get_nowait()
+            if pedido[0][0] in matriculas:
+                return lote, pedido
+            matriculas.add(pedido[0][0])
+            lote.append(pedido)
+        return lote, None
+    
+    async def _escritor(self) -> None:
+        adiado = None
+        while True:
+            lote, adiado = self._montar_lote(adiado or await self._fila.get())
+            try:
+                status = await asyncio.to_thread(self.sistema.registrar_eventos_em_lote, [e for e, _ in lote])
+            except Exception as erro:
+                for _, futuro in lote:
+                    futuro.set_exception(erro)
+                continue
+            for (_, futuro), resultado in zip(lote, status):
+                futuro.set_result(resultado)
+    
+    async def registrar(self, matricula: str, tipo: str, data: str = None, hora: str = None) -> str:
+        """Enfileira um evento e espera o escritor gravá-lo; retorna o valor de StatusLote"""
+        futuro = asyncio.get_running_loop().create_future()
+        await self._fila.put(((matricula, tipo, data, hora), futuro))
+        return await futuro
+    
+    async def _atender(self, leitor: asyncio.StreamReader, escritor: asyncio.StreamWriter) -> None:
+        try:
+            while linha := await leitor.readline():
+                partes = linha.decode('utf-8', errors='replace').split()
+                if not partes:
+                    continue
+                if len(partes) in (2, 4):
+                    tipo, matricula, *data_hora = partes
+                    resposta = await self.registrar(matricula, tipo, *data_hora)
+                else:
+                    resposta = "ERRO formato: TIPO MATRICULA [DD/MM/YYYY HH:MM]"
+                escritor.write(f"{resposta}\n".encode())
+                await escritor.drain()
+        except ConnectionError:
+            pass
+        finally:
+            escritor.close()
+    
+    async def iniciar(self, host: str = '127.0.0.1', porta: int = 8765) -> asyncio.Server:
+        """Abre o servidor e o escritor; use `servir` para rodar até ser interrompido"""
+        self._fila = asyncio.Queue(TAMANHO_FILA)
+        self._tarefa_escritor = asyncio.create_task(self._escritor())
+        return await asyncio.start_server(self._atender, host, porta)
+    
+    async def servir(self, host: str = '127.0.0.1', porta: int = 8765) -> None:
+        servidor = await self.iniciar(host, porta)
+        print(f"🕐 Serviço de ponto em {host}:{porta}")
+        try:
+            async with servidor:
+                await servidor.serve_forever()
+        finally:
+            self._tarefa_escritor.cancel()
+
+
+if __name__ == "__main__":
+    diario = DiarioPonto('dados_ponto')
+    sistema = SistemaPonto(diario=diario)
+    diario.restaurar(sistema)
+    try:
+        asyncio.run(ServicoPonto(sistema).servir())
+    except KeyboardInterrupt:
+        print("\n👋 Serviço encerrado!")
+    finally:
+        diario.gravar_snapshot(sistema)
+        diario.fechar()
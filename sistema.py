@@ -1,42 +1,186 @@
+import os
+import threading
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+from functools import wraps
+from io import BytesIO
 from datetime import datetime
-from enums import Turno, TipoEvento
-from modelos import Funcionario
+from enums import TipoEvento, StatusLote
+from modelos import Funcionario, TURNOS, IDADE_MINIMA, IDADE_MAXIMA
+from armazenamento import Armazenamento, ArmazenamentoMemoria
+from diario import DiarioPonto
+from cache import CacheConsultas
+from calculos import horas_por_matricula, detectar_anomalias, VerificadorAnomalias
+from folha import gerar_folha
+
+
+_TIPOS_EVENTO = {chave: t.value for t in TipoEvento for chave in (t, t.value, t.value.lower())}
+_FORMATO_INSTANTE = "%d/%m/%Y %H:%M"
+LIMITE_BARRAS_IDADE = 40
+_TABELAS = ('funcionarios', 'registros')
+_MENSAGENS_STATUS = {
+    StatusLote.FUNCIONARIO_INEXISTENTE.value: "❌ Funcionário não existe!",
+    StatusLote.DATA_INVALIDA.value: "❌ Data ou hora inválida!",
+    StatusLote.SEM_ENTRADA.value: "❌ Nenhuma entrada registrada hoje!"
+}
+
+
+def _instante(data: str = None, hora: str = None) -> datetime:
+    """Combina data (DD/MM/YYYY) e hora (HH:MM), usando agora para o que faltar; None se inválidas"""
+    agora = datetime.now()
+    try:
+        return datetime.strptime(f"{data or agora.strftime('%d/%m/%Y')} {hora or agora.strftime('%H:%M')}",
+                                 _FORMATO_INSTANTE)
+    except ValueError:
+        return None
+
+
+def _iso(instantes: np.ndarray) -> list:
+    return [str(i) for i in instantes.astype('datetime64[s]')]
+
+
+def _exclusivo(metodo):
+    """Executa o método segurando a trava de escrita do sistema"""
+    @wraps(metodo)
+    def envolvido(self, *args, **kwargs):
+        with self._trava:
+            return metodo(self, *args, **kwargs)
+    return envolvido
+
+
+def imprimir_relatorio(estatisticas: dict, total_registros: int) -> None:
+    """Imprime o relatório a partir das estatísticas do cadastro e do total de registros"""
+    if estatisticas['total'] == 0:
+        print("❌ Nenhum funcionário cadastrado!")
+        return
+    
+    print("\n" + "="*70)
+    print("RELATÓRIO DE PONTO".center(70))
+    print("="*70)
+    print(f"\n📊 Total de funcionários: {estatisticas['total']}")
+    print(f"📊 Total de registros: {total_registros}")
+    
+    print("\n📈 Funcionários por turno:")
+    for turno, count in estatisticas['por_turno'].items():
+        print(f"   • {turno.capitalize()}: {count}")
+    
+    print(f"\n📈 Idade média: {estatisticas['idade_media']:.1f} anos")
+    print(f"📈 Idade mínima: {estatisticas['idade_min']} anos")
+    print(f"📈 Idade máxima: {estatisticas['idade_max']} anos")
+    print("\n" + "="*70 + "\n")
 
 
 class SistemaPonto:
     """Sistema de gerenciamento de ponto"""
     
-    def __init__(self):
-        self.funcionarios_df = pd.DataFrame(columns=['matricula', 'nome', 'idade', 'turno'])
-        self.registros_ponto_df = pd.DataFrame(columns=['matricula', 'nome', 'data', 'entrada', 'saida'])
+    def __init__(self, armazenamento: Armazenamento = None, diario: DiarioPonto = None,
+                 capacidade_cache: int = 256):
+        if diario is not None and armazenamento is not None and armazenamento.duravel:
+            # Reaplicar o diário num banco que já tem as operações gravaria tudo em dobro
+            raise ValueError("O diário é para o armazenamento em memória; este backend já grava cada operação")
+        self.armazenamento = armazenamento or ArmazenamentoMemoria()
+        self.diario = diario
+        self.cache = CacheConsultas(capacidade_cache)
+        self.metricas = None
+        self.verificador = None
+        self._trava = threading.RLock()
+        self._grupo = threading.Condition()
+        self._pendentes = []
+        self._liderando = False
         pd.set_option('display.max_columns', None)
         pd.set_option('display.width', None)
     
+    @property
+    def funcionarios_df(self) -> pd.DataFrame:
+        """Funcionários como DataFrame (somente leitura, montado sob demanda)"""
+        return self.armazenamento.funcionarios_df()
+    
+    @property
+    def registros_ponto_df(self) -> pd.DataFrame:
+        """Registros de ponto como DataFrame (somente leitura, montado sob demanda)"""
+        return self.armazenamento.registros_df()
+    
+    def _anotar(self, operacao: str, linhas) -> None:
+        """Invalida o cache do que as operações mudaram, grava no diário (se houver) e tira snapshot na hora"""
+        linhas = list(linhas)
+        tabela = 'funcionarios' if operacao == DiarioPonto.FUNCIONARIO else 'registros'
+        self.cache.invalidar([tabela, *{('matricula', linha[0]) for linha in linhas}])
+        if self.diario is None:
+            return
+        self.diario.registrar(operacao, linhas)
+        if self.diario.precisa_snapshot():
+            self.diario.gravar_snapshot(self)
+    
     # ---- GERENCIAMENTO DE FUNCIONÁRIOS ----
     
+    @_exclusivo
     def cadastrar_funcionario(self, matricula: str, nome: str, idade: int, turno: str) -> bool:
         """Cadastra novo funcionário"""
-        turnos_validos = [t.value for t in Turno]
-        if turno.lower() not in turnos_validos:
-            print(f"❌ Turno deve ser: {', '.join(turnos_validos)}")
+        if turno.lower() not in TURNOS:
+            print(f"❌ Turno deve ser: {', '.join(TURNOS)}")
             return False
         
-        if matricula in self.funcionarios_df['matricula'].values:
+        if not IDADE_MINIMA <= idade <= IDADE_MAXIMA:
+            print(f"❌ Idade deve estar entre {IDADE_MINIMA} e {IDADE_MAXIMA} anos!")
+            return False
+        
+        if self.armazenamento.obter_funcionario(matricula) is not None:
             print(f"❌ Matrícula {matricula} já existe!")
             return False
         
-        novo = pd.DataFrame({
-            'matricula': [matricula],
-            'nome': [nome],
-            'idade': [idade],
-            'turno': [turno.lower()]
-        })
-        self.funcionarios_df = pd.concat([self.funcionarios_df, novo], ignore_index=True)
+        self.armazenamento.inserir_funcionario(matricula, nome, idade, turno.lower())
+        self._anotar(DiarioPonto.FUNCIONARIO, [(matricula, nome, int(idade), turno.lower())])
         print(f"✅ {nome} cadastrado!")
         return True
     
+    @_exclusivo
+    def cadastrar_funcionarios_em_lote(self, origem) -> np.ndarray:
+        """Cadastra funcionários de um CSV, Parquet ou DataFrame e retorna o status de cada linha
+        
+        A origem deve ter as colunas matricula, nome, idade e turno. Linhas com matrícula ou
+        nome vazios, turno inválido, idade fora de IDADE_MINIMA..IDADE_MAXIMA e matrículas
+        repetidas (no arquivo ou já cadastradas) são recusadas; as válidas entram na tabela
+        com um único append.
+        """
+        colunas = ['matricula', 'nome', 'idade', 'turno']
+        if isinstance(origem, pd.DataFrame):
+            lote = origem[colunas].reset_index(drop=True)
+        elif str(origem).lower().endswith('.parquet'):
+            lote = pd.read_parquet(origem, columns=colunas)
+        else:
+            lote = pd.read_csv(origem, usecols=colunas, dtype={'matricula': str, 'nome': str, 'turno': str})
+        
+        matricula = lote['matricula'].astype('string').str.strip().fillna('')
+        nome = lote['nome'].astype('string').str.strip().fillna('')
+        turno = lote['turno'].astype(str).str.strip().str.lower()
+        idade = pd.to_numeric(lote['idade'], errors='coerce')
+        
+        status = np.full(len(lote), StatusLote.OK.value, dtype=object)
+        fora = (idade % 1 != 0) | ~idade.between(IDADE_MINIMA, IDADE_MAXIMA)
+        status[(idade.isna() | fora).to_numpy()] = StatusLote.IDADE_INVALIDA.value
+        status[~turno.isin(list(TURNOS)).to_numpy()] = StatusLote.TURNO_INVALIDO.value
+        status[(nome == '').to_numpy()] = StatusLote.NOME_INVALIDO.value
+        status[(matricula == '').to_numpy()] = StatusLote.MATRICULA_INVALIDA.value
+        
+        # Repetição só conta entre linhas válidas: uma linha recusada não bloqueia a matrícula
+        ok = status == StatusLote.OK.value
+        existentes = pd.notna(self.armazenamento.nomes_funcionarios(matricula))
+        repetidas = matricula.where(ok).duplicated().to_numpy() | existentes
+        status[ok & repetidas] = StatusLote.MATRICULA_DUPLICADA.value
+        
+        validos = np.flatnonzero(status == StatusLote.OK.value)
+        if len(validos):
+            novos = (
+                matricula.to_numpy()[validos],
+                nome.to_numpy()[validos],
+                idade.to_numpy()[validos].astype(np.int64),
+                turno.to_numpy()[validos]
+            )
+            self.armazenamento.inserir_funcionarios(*novos)
+            self._anotar(DiarioPonto.FUNCIONARIO, zip(*(coluna.tolist() for coluna in novos)))
+        
+        return status
+    
     def listar_funcionarios(self) -> None:
         """Lista todos os funcionários"""
         if self.funcionarios_df.empty:
@@ -48,141 +192,320 @@ class SistemaPonto:
     
     def get_funcionario(self, matricula: str) -> Funcionario:
         """Obtém funcionário pela matrícula"""
-        if matricula not in self.funcionarios_df['matricula'].values:
+        linha = self.armazenamento.obter_funcionario(matricula)
+        if linha is None:
             return None
-        
-        row = self.funcionarios_df[self.funcionarios_df['matricula'] == matricula].iloc[0]
-        turno_str = row['turno']
-        turno = Turno(turno_str) if turno_str in [t.value for t in Turno] else None
-        
-        return Funcionario(row['matricula'], row['nome'], row['idade'], turno)
+        return Funcionario.visao(self.armazenamento, matricula, linha)
+    
+    def buscar_funcionarios(self, prefixo: str, limite: int = 10) -> list:
+        """Funcionários cujo nome começa pelo prefixo em qualquer palavra ("jo sil" acha "João Silva")"""
+        return [Funcionario.visao(self.armazenamento, matricula)
+                for matricula in self.armazenamento.buscar_funcionarios(prefixo, limite)]
     
     # ---- REGISTRO DE PONTO ----
     
     def registrar_evento(self, matricula: str, tipo: TipoEvento, data: str = None, hora: str = None) -> bool:
-        """Registra evento de entrada/saída"""
-        if tipo == TipoEvento.ENTRADA:
-            return self._registrar_entrada(matricula, data, hora)
-        elif tipo == TipoEvento.SAIDA:
-            return self._registrar_saida(matricula, data, hora)
-        return False
+        """Registra evento de entrada/saída
+        
+        Pode ser chamado de várias threads: eventos que chegam juntos são gravados
+        em um único lote (group commit) pela thread que estiver liderando.
+        """
+        if tipo not in (TipoEvento.ENTRADA, TipoEvento.SAIDA):
+            return False
+        pedido = [(matricula, tipo, data, hora), None]
+        with self._grupo:
+            self._pendentes.append(pedido)
+            while pedido[1] is None:
+                if self._liderando:
+                    self._grupo.wait()
+                    continue
+                self._liderando = True
+                lote = self._separar_grupo()
+                self._grupo.release()
+                try:
+                    resultados = self._gravar_grupo([evento for evento, _ in lote])
+                except Exception as erro:
+                    resultados = [erro] * len(lote)
+                finally:
+                    self._grupo.acquire()
+                    self._liderando = False
+                for item, resultado in zip(lote, resultados):
+                    item[1] = resultado
+                self._grupo.notify_all()
+        if isinstance(pedido[1], Exception):
+            raise pedido[1]
+        return pedido[1]
     
+    def _separar_grupo(self) -> list:
+        """Tira da fila os pedidos do próximo grupo, no máximo um por matrícula (mantém a ordem de cada uma)"""
+        lote, matriculas, restantes = [], set(), []
+        for pedido in self._pendentes:
+            if pedido[0][0] in matriculas:
+                restantes.append(pedido)
+            else:
+                matriculas.add(pedido[0][0])
+                lote.append(pedido)
+        self._pendentes = restantes
+        return lote
+    
+    def _gravar_grupo(self, eventos: list) -> list:
+        """Grava um grupo de eventos: sozinho vai pelo caminho direto, vários viram um lote só"""
+        if len(eventos) == 1:
+            matricula, tipo, data, hora = eventos[0]
+            if tipo == TipoEvento.ENTRADA:
+                return [self._registrar_entrada(matricula, data, hora)]
+            return [self._registrar_saida(matricula, data, hora)]
+        
+        status = self.registrar_eventos_em_lote(eventos)
+        nomes = self.armazenamento.nomes_funcionarios([evento[0] for evento in eventos])
+        for (_, tipo, _, _), resultado, nome in zip(eventos, status, nomes):
+            if resultado == StatusLote.OK.value:
+                print(f"✅ {'Entrada' if tipo == TipoEvento.ENTRADA else 'Saída'} registrada para {nome}")
+            else:
+                print(_MENSAGENS_STATUS[resultado])
+        return (status == StatusLote.OK.value).tolist()
+    
+    @_exclusivo
     def _registrar_entrada(self, matricula: str, data: str = None, hora: str = None) -> bool:
         """Registra entrada"""
-        if matricula not in self.funcionarios_df['matricula'].values:
+        funcionario = self.armazenamento.obter_funcionario(matricula)
+        if funcionario is None:
             print(f"❌ Funcionário não existe!")
             return False
         
-        data = data or datetime.now().strftime("%d/%m/%Y")
-        hora = hora or datetime.now().strftime("%H:%M")
-        nome = self.funcionarios_df[self.funcionarios_df['matricula'] == matricula]['nome'].values[0]
-        
-        novo = pd.DataFrame({
-            'matricula': [matricula],
-            'nome': [nome],
-            'data': [data],
-            'entrada': [hora],
-            'saida': [None]
-        })
-        self.registros_ponto_df = pd.concat([self.registros_ponto_df, novo], ignore_index=True)
-        print(f"✅ Entrada registrada para {nome}")
+        entrada = _instante(data, hora)
+        if entrada is None:
+            print("❌ Data ou hora inválida!")
+            return False
+        
+        self.armazenamento.inserir_entrada(matricula, entrada)
+        self._anotar(DiarioPonto.ENTRADA, [(matricula, entrada.isoformat())])
+        print(f"✅ Entrada registrada para {funcionario[0]}")
         return True
     
+    @_exclusivo
     def _registrar_saida(self, matricula: str, data: str = None, hora: str = None) -> bool:
         """Registra saída"""
-        if self.registros_ponto_df.empty:
-            print("❌ Nenhum registro disponível!")
+        saida = _instante(data, hora)
+        if saida is None:
+            print("❌ Data ou hora inválida!")
             return False
         
-        data = data or datetime.now().strftime("%d/%m/%Y")
-        hora = hora or datetime.now().strftime("%H:%M")
-        
-        registros = self.registros_ponto_df[
-            (self.registros_ponto_df['matricula'] == matricula) & 
-            (self.registros_ponto_df['data'] == data) &
-            (self.registros_ponto_df['saida'].isna())
-        ]
-        
-        if registros.empty:
-            print(f"❌ Nenhuma entrada registrada hoje!")
+        if not self.armazenamento.fechar_saida(matricula, saida):
+            if self.armazenamento.contar_registros() == 0:
+                print("❌ Nenhum registro disponível!")
+            else:
+                print(f"❌ Nenhuma entrada registrada hoje!")
             return False
         
-        indice = registros.index[0]
-        self.registros_ponto_df.at[indice, 'saida'] = hora
-        nome = self.funcionarios_df[self.funcionarios_df['matricula'] == matricula]['nome'].values[0]
+        self._anotar(DiarioPonto.SAIDA, [(matricula, saida.isoformat())])
+        nome = self.armazenamento.obter_funcionario(matricula)[0]
         print(f"✅ Saída registrada para {nome}")
         return True
     
-    def consultar_eventos(self, matricula: str) -> pd.DataFrame:
-        """Consulta eventos de um funcionário"""
-        return self.registros_ponto_df[self.registros_ponto_df['matricula'] == matricula]
+    @_exclusivo
+    def registrar_eventos_em_lote(self, eventos) -> np.ndarray:
+        """Registra vários eventos (matricula, tipo, data, hora) e retorna o status de cada um
+        
+        Aceita um DataFrame com essas colunas ou um iterável de tuplas. As entradas do
+        lote são anexadas de uma só vez antes de as saídas serem casadas com os turnos
+        abertos; o retorno é um array com um valor de StatusLote por linha.
+        """
+        colunas = ['matricula', 'tipo', 'data', 'hora']
+        if isinstance(eventos, pd.DataFrame):
+            lote = eventos[colunas].reset_index(drop=True)
+        else:
+            lote = pd.DataFrame(list(eventos), columns=colunas)
+        
+        agora = datetime.now()
+        data = lote['data'].mask(lote['data'].isna() | (lote['data'] == ''), agora.strftime("%d/%m/%Y"))
+        hora = lote['hora'].mask(lote['hora'].isna() | (lote['hora'] == ''), agora.strftime("%H:%M"))
+        instantes = pd.to_datetime(data.astype(str) + ' ' + hora.astype(str), format=_FORMATO_INSTANTE,
+                                   errors='coerce').to_numpy(dtype='datetime64[ns]')
+        tipo = lote['tipo'].map(_TIPOS_EVENTO)
+        existe = pd.notna(self.armazenamento.nomes_funcionarios(lote['matricula']))
+        
+        status = np.full(len(lote), StatusLote.OK.value, dtype=object)
+        status[np.isnat(instantes)] = StatusLote.DATA_INVALIDA.value
+        status[tipo.isna().to_numpy()] = StatusLote.TIPO_INVALIDO.value
+        status[~existe] = StatusLote.FUNCIONARIO_INEXISTENTE.value
+        validos = status == StatusLote.OK.value
+        
+        entradas = np.flatnonzero(validos & (tipo == TipoEvento.ENTRADA.value).to_numpy())
+        if len(entradas):
+            matriculas = lote['matricula'].to_numpy()[entradas]
+            self.armazenamento.inserir_entradas(matriculas, instantes[entradas])
+            self._anotar(DiarioPonto.ENTRADA, zip(matriculas.tolist(), _iso(instantes[entradas])))
+        
+        saidas = np.flatnonzero(validos & (tipo == TipoEvento.SAIDA.value).to_numpy())
+        if len(saidas):
+            matriculas = lote['matricula'].to_numpy()[saidas]
+            fechadas = self.armazenamento.fechar_saidas(matriculas, instantes[saidas])
+            status[saidas[~fechadas]] = StatusLote.SEM_ENTRADA.value
+            self._anotar(DiarioPonto.SAIDA, zip(matriculas[fechadas].tolist(), _iso(instantes[saidas][fechadas])))
+        
+        return status
+    
+    def consultar_eventos(self, matricula: str, inicio: datetime = None, fim: datetime = None) -> pd.DataFrame:
+        """Consulta eventos de um funcionário, opcionalmente só entre as datas inicio e fim"""
+        return self._em_cache(
+            ('eventos', matricula, inicio, fim), [('matricula', matricula)],
+            lambda: self._formatar_registros(self.armazenamento.eventos_funcionario(matricula, inicio, fim))
+        )
+    
+    def _em_cache(self, chave, dependencias, calcular):
+        """Resultado pelo cache de consultas; DataFrames saem como cópia para não alterar o que está guardado"""
+        resultado = self.cache.obter(chave, dependencias, calcular, self.armazenamento.versao_externa)
+        return resultado.copy() if isinstance(resultado, pd.DataFrame) else resultado
+    
+    def iterar_eventos(self, matricula: str, tamanho_pagina: int = 20, cursor: int = 0):
+        """Gera páginas de eventos do funcionário; o índice é o id, o último id serve de cursor"""
+        for bloco in self.armazenamento.iterar_registros(matricula, cursor, tamanho_pagina):
+            yield self._formatar_registros(bloco.set_index('id'))
+    
+    def iterar_registros_ponto(self, tamanho_pagina: int = 50, cursor: int = 0):
+        """Gera páginas de todos os registros de ponto, em ordem de id"""
+        for bloco in self.armazenamento.iterar_registros(None, cursor, tamanho_pagina):
+            yield self._formatar_registros(bloco.set_index('id'))
+    
+    def _formatar_registros(self, registros: pd.DataFrame) -> pd.DataFrame:
+        """Registros para exibição: nome buscado no cadastro, data e horas como texto"""
+        return pd.DataFrame({
+            'matricula': registros['matricula'],
+            'nome': self.armazenamento.nomes_funcionarios(registros['matricula']),
+            'data': registros['entrada'].dt.strftime('%d/%m/%Y'),
+            'entrada': registros['entrada'].dt.strftime('%H:%M'),
+            'saida': registros['saida'].dt.strftime('%H:%M')
+        }, index=registros.index)
     
-    def listar_registros_ponto(self) -> None:
-        """Lista todos os registros de ponto"""
-        if self.registros_ponto_df.empty:
+    def listar_registros_ponto(self, tamanho_pagina: int = 1000) -> None:
+        """Lista todos os registros de ponto, imprimindo uma página por vez"""
+        if self.armazenamento.contar_registros() == 0:
             print("📋 Nenhum registro de ponto.")
             return
         print("\n" + "="*80)
-        print(self.registros_ponto_df.to_string(index=False))
+        for pagina in self.iterar_registros_ponto(tamanho_pagina):
+            print(pagina.to_string(index=False))
         print("="*80 + "\n")
     
     # ---- RELATÓRIOS E GRÁFICOS ----
     
+    def horas_trabalhadas_periodo(self, inicio: datetime = None, fim: datetime = None) -> pd.DataFrame:
+        """Horas trabalhadas e turnos fechados de todos os funcionários no período"""
+        return self._em_cache(('horas', inicio, fim), _TABELAS, lambda: self._calcular_horas(inicio, fim))
+    
+    def _calcular_horas(self, inicio: datetime, fim: datetime) -> pd.DataFrame:
+        funcionarios = self.funcionarios_df
+        resumo = horas_por_matricula(self.armazenamento.registros_periodo(inicio, fim), funcionarios, inicio, fim)
+        resumo.insert(1, 'nome', funcionarios['nome'].to_numpy())
+        return resumo
+    
+    def verificar_anomalias(self, incremental: bool = False, hoje: datetime = None) -> pd.DataFrame:
+        """Turnos sem saída, entradas duplicadas, turnos sobrepostos e durações impossíveis
+        
+        Com incremental=True só olha o que entrou desde a verificação anterior, usando
+        `self.verificador` (crie um VerificadorAnomalias com arquivo para guardar a marca entre execuções).
+        """
+        if not incremental:
+            dia = pd.Timestamp(hoje or datetime.now()).normalize()
+            return self._em_cache(('anomalias', dia), _TABELAS,
+                                  lambda: detectar_anomalias(self.registros_ponto_df, self.funcionarios_df, dia))
+        if self.verificador is None:
+            self.verificador = VerificadorAnomalias(self.armazenamento)
+        return self.verificador.verificar(self.funcionarios_df, hoje)
+    
+    def gerar_folha_pagamento(self, inicio: datetime, fim: datetime, trabalhadores: int = 1) -> pd.DataFrame:
+        """Horas, faltas e horas extras de cada funcionário no período
+        
+        `trabalhadores` > 1 divide o cálculo entre processos (mesmo resultado da execução serial).
+        """
+        return self._em_cache(
+            ('folha', inicio, fim), _TABELAS,
+            lambda: gerar_folha(self.armazenamento.registros_periodo(inicio, fim), self.funcionarios_df,
+                                inicio, fim, trabalhadores)
+        )
+    
     def gerar_relatorio_completo(self) -> None:
         """Gera relatório com estatísticas"""
-        if self.funcionarios_df.empty:
-            print("❌ Nenhum funcionário cadastrado!")
-            return
+        imprimir_relatorio(*self._em_cache(
+            ('relatorio',), _TABELAS,
+            lambda: (self.armazenamento.estatisticas_funcionarios(), self.armazenamento.contar_registros())
+        ))
+    
+    def _renderizar(self, nome: str, desenhar, destino, formato: str) -> None:
+        """Sem destino abre a janela do matplotlib; com destino (caminho ou buffer) grava PNG/SVG sem interface
         
-        print("\n" + "="*70)
-        print("RELATÓRIO DE PONTO".center(70))
-        print("="*70)
-        print(f"\n📊 Total de funcionários: {len(self.funcionarios_df)}")
-        print(f"📊 Total de registros: {len(self.registros_ponto_df)}")
-        
-        print("\n📈 Funcionários por turno:")
-        for turno, count in self.funcionarios_df['turno'].value_counts().items():
-            print(f"   • {turno.capitalize()}: {count}")
-        
-        media_idade = self.funcionarios_df['idade'].mean()
-        print(f"\n📈 Idade média: {media_idade:.1f} anos")
-        print(f"📈 Idade mínima: {self.funcionarios_df['idade'].min()} anos")
-        print(f"📈 Idade máxima: {self.funcionarios_df['idade'].max()} anos")
-        print("\n" + "="*70 + "\n")
-    
-    def grafico_barras_idade(self) -> None:
-        """Gráfico de funcionários por idade"""
-        if self.funcionarios_df.empty:
+        A imagem gravada fica no cache de consultas e só é redesenhada quando o cadastro muda.
+        O matplotlib só é importado aqui, na primeira vez que um gráfico é pedido.
+        """
+        if destino is None:
+            import matplotlib.pyplot as plt
+            desenhar(plt.figure())
+            plt.show()
+            return
+        imagem = self._em_cache(('grafico', nome, formato), ['funcionarios'],
+                                lambda: self._gerar_imagem(desenhar, formato))
+        if isinstance(destino, (str, os.PathLike)):
+            with open(destino, 'wb') as arquivo:
+                arquivo.write(imagem)
+        else:
+            destino.write(imagem)
+    
+    @staticmethod
+    def _gerar_imagem(desenhar, formato: str) -> bytes:
+        from matplotlib.figure import Figure
+        figura = Figure()
+        desenhar(figura)
+        buffer = BytesIO()
+        figura.savefig(buffer, format=formato)
+        return buffer.getvalue()
+    
+    def grafico_barras_idade(self, destino=None, formato: str = 'png') -> None:
+        """Gráfico de funcionários por idade (histograma quando há muitos funcionários)"""
+        if self.armazenamento.estatisticas_funcionarios()['total'] == 0:
             print("❌ Nenhum funcionário cadastrado!")
             return
-        
-        df = self.funcionarios_df.sort_values('idade')
-        plt.figure(figsize=(12, 6))
-        plt.bar(df['nome'], df['idade'], color='steelblue', edgecolor='navy', alpha=0.7)
-        plt.xlabel('Funcionário', fontsize=12, fontweight='bold')
-        plt.ylabel('Idade', fontsize=12, fontweight='bold')
-        plt.title('Funcionários por Idade', fontsize=14, fontweight='bold')
-        plt.xticks(rotation=45, ha='right')
-        plt.grid(axis='y', alpha=0.3)
-        plt.tight_layout()
-        plt.show()
-    
-    def grafico_pizza_turno(self) -> None:
+        self._renderizar('idade', self._desenhar_idades, destino, formato)
+    
+    def _desenhar_idades(self, figura: 'Figure') -> None:
+        df = self.funcionarios_df
+        figura.set_size_inches(12, 6)
+        eixo = figura.add_subplot()
+        if len(df) > LIMITE_BARRAS_IDADE:
+            idades = df['idade'].to_numpy()
+            faixas = min(int(idades.max()) - int(idades.min()) + 1, 60)
+            eixo.hist(idades, bins=faixas, color='steelblue', edgecolor='navy', alpha=0.7)
+            eixo.set_xlabel('Idade', fontsize=12, fontweight='bold')
+            eixo.set_ylabel('Funcionários', fontsize=12, fontweight='bold')
+        else:
+            df = df.sort_values('idade')
+            eixo.bar(df['nome'], df['idade'], color='steelblue', edgecolor='navy', alpha=0.7)
+            eixo.set_xlabel('Funcionário', fontsize=12, fontweight='bold')
+            eixo.set_ylabel('Idade', fontsize=12, fontweight='bold')
+            for rotulo in eixo.get_xticklabels():
+                rotulo.set(rotation=45, ha='right')
+        eixo.set_title('Funcionários por Idade', fontsize=14, fontweight='bold')
+        eixo.grid(axis='y', alpha=0.3)
+        figura.tight_layout()
+    
+    def grafico_pizza_turno(self, destino=None, formato: str = 'png') -> None:
         """Gráfico de funcionários por turno"""
-        if self.funcionarios_df.empty:
+        if self.armazenamento.estatisticas_funcionarios()['total'] == 0:
             print("❌ Nenhum funcionário cadastrado!")
             return
-        
-        turno_counts = self.funcionarios_df['turno'].value_counts()
+        self._renderizar('turno', self._desenhar_turnos, destino, formato)
+    
+    def _desenhar_turnos(self, figura: 'Figure') -> None:
+        turno_counts = pd.Series(self.armazenamento.estatisticas_funcionarios()['por_turno'])
         cores = {'matutino': '#FFD700', 'vespertino': '#87CEEB', 'noturno': '#2F4F4F'}
         cores_lista = [cores.get(turno, '#808080') for turno in turno_counts.index]
         
-        plt.figure(figsize=(10, 8))
-        plt.pie(turno_counts.values,
-                labels=[f"{t.capitalize()}\n({c})" for t, c in zip(turno_counts.index, turno_counts.values)],
-                autopct='%1.1f%%',
-                colors=cores_lista,
-                startangle=90)
-        plt.title('Distribuição por Turno', fontsize=14, fontweight='bold')
-        plt.tight_layout()
-        plt.show()
+        figura.set_size_inches(10, 8)
+        eixo = figura.add_subplot()
+        eixo.pie(turno_counts.values,
+                 labels=[f"{t.capitalize()}\n({c})" for t, c in zip(turno_counts.index, turno_counts.values)],
+                 autopct='%1.1f%%',
+                 colors=cores_lista,
+                 startangle=90)
+        eixo.set_title('Distribuição por Turno', fontsize=14, fontweight='bold')
+        figura.tight_layout()